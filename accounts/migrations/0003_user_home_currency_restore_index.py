@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_home_currency_drop_index"),
+        ("currencies", "0003_currency_active_code_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="home_currency",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User's preferred currency for reporting",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="users",
+                to="currencies.currency",
+            ),
+        ),
+    ]
@@ -3,6 +3,7 @@ Custom User model extending Django's AbstractUser.
 """
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 
 
 class User(AbstractUser):
@@ -32,6 +33,9 @@ class User(AbstractUser):
         null=True,
         blank=True,
         related_name='users',
+        # Indexed despite low selectivity: deleting a Currency nulls out
+        # its users' references (SET_NULL), which would otherwise scan the
+        # whole users table
         help_text="User's preferred currency for reporting"
     )
     email_verified = models.BooleanField(
@@ -50,6 +54,10 @@ class User(AbstractUser):
     # Make email required
     REQUIRED_FIELDS = ['email']
 
+    # Service classes, bound on first use to avoid circular imports
+    _asset_service = None
+    _liability_service = None
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
@@ -58,18 +66,32 @@ class User(AbstractUser):
     def __str__(self):
         return self.username
 
-    def get_home_currency(self):
+    @cached_property
+    def home_currency_resolved(self):
         """
-        Get user's home currency, fallback to USD if not set.
+        User's home currency, fallback to USD if not set.
+
+        Resolved once per instance; delete the attribute to re-resolve
+        after changing home_currency.
 
         Returns:
             Currency object
         """
-        if self.home_currency:
-            return self.home_currency
-
         # Import here to avoid circular imports
         from currencies.models import Currency
+        from currencies.services import CurrencyCache
+
+        if self.home_currency_id is not None:
+            # Use an already loaded relation, otherwise the in-process
+            # currency cache, so fresh User instances skip the FK query
+            if User.home_currency.is_cached(self):
+                return self.home_currency
+            return CurrencyCache.get_by_id(self.home_currency_id) or self.home_currency
+
+        usd = CurrencyCache.get_by_code('USD')
+        if usd is not None:
+            return usd
+
         usd, _ = Currency.objects.get_or_create(
             code='USD',
             defaults={
@@ -79,6 +101,15 @@ class User(AbstractUser):
         )
         return usd
 
+    def get_home_currency(self):
+        """
+        Get user's home currency, fallback to USD if not set.
+
+        Returns:
+            Currency object
+        """
+        return self.home_currency_resolved
+
     def get_total_assets(self):
         """
         Calculate total assets in home currency.
@@ -86,8 +117,10 @@ class User(AbstractUser):
         Returns:
             Decimal: Total value of all assets in home currency
         """
-        from assets.services import AssetService
-        return AssetService.calculate_total_assets(self)
+        if User._asset_service is None:
+            from assets.services import AssetService
+            User._asset_service = AssetService
+        return User._asset_service.calculate_total_assets(self)
 
     def get_total_liabilities(self):
         """
@@ -96,8 +129,10 @@ class User(AbstractUser):
         Returns:
             Decimal: Total value of all liabilities in home currency
         """
-        from liabilities.services import LiabilityService
-        return LiabilityService.calculate_total_liabilities(self)
+        if User._liability_service is None:
+            from liabilities.services import LiabilityService
+            User._liability_service = LiabilityService
+        return User._liability_service.calculate_total_liabilities(self)
 
     def get_net_worth(self):
         """
@@ -2,9 +2,58 @@
 Admin configuration for Asset models.
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import Asset, AssetHistory
 
 
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that estimates the size of large, unfiltered tables.
+
+    On PostgreSQL the planner's row estimate (pg_class.reltuples) is used
+    instead of SELECT COUNT(*) when no filter or search is applied. Small
+    tables, filtered querysets and other databases use the exact count.
+    """
+    ESTIMATE_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        """Return the estimated or exact number of objects."""
+        queryset = self.object_list
+        connection = connections[queryset.db]
+
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+
+            if row and row[0] >= self.ESTIMATE_THRESHOLD:
+                return row[0]
+
+        return super().count
+
+
+class AssetChangeList(ChangeList):
+    """
+    Changelist that loads only the columns rendered in the asset list.
+    """
+    LIST_FIELDS = [
+        'name', 'asset_type', 'value', 'institution', 'is_active', 'last_valued_at',
+        'user__username', 'currency__code', 'currency__name',
+    ]
+
+    def get_queryset(self, request, exclude_parameters=None):
+        """Skip wide columns such as notes and account_number."""
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*self.LIST_FIELDS)
+
+
 class AssetHistoryInline(admin.TabularInline):
     """
     Inline admin for asset history.
@@ -27,6 +76,8 @@ class AssetAdmin(admin.ModelAdmin):
     Admin interface for Asset model.
     """
     list_display = ['name', 'user', 'asset_type', 'value', 'currency', 'institution', 'is_active', 'last_valued_at']
+    list_select_related = ['user', 'currency']
+    autocomplete_fields = ['user', 'currency']
     list_filter = ['asset_type', 'currency', 'is_active', 'created_at']
     search_fields = ['name', 'user__username', 'institution', 'notes']
     ordering = ['-updated_at']
@@ -52,11 +103,15 @@ class AssetAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Filter queryset for non-superusers to only show their own assets."""
-        qs = super().get_queryset(request).select_related('user', 'currency')
+        qs = super().get_queryset(request)
         if not request.user.is_superuser:
             qs = qs.filter(user=request.user)
         return qs
 
+    def get_changelist(self, request, **kwargs):
+        """Use the column-restricted changelist."""
+        return AssetChangeList
+
     def get_form(self, request, obj=None, **kwargs):
         """Customize form to hide user field for non-superusers."""
         form = super().get_form(request, obj, **kwargs)
@@ -79,6 +134,9 @@ class AssetHistoryAdmin(admin.ModelAdmin):
     Admin interface for AssetHistory model.
     """
     list_display = ['asset', 'value', 'currency', 'source', 'recorded_at']
+    list_select_related = ['asset__currency', 'currency']
+    autocomplete_fields = ['asset', 'currency']
+    paginator = FasterAdminPaginator
     list_filter = ['source', 'currency', 'recorded_at']
     search_fields = ['asset__name', 'asset__user__username']
     ordering = ['-recorded_at']
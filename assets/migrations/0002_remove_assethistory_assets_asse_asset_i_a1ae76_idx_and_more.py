@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0001_initial"),
+        ("currencies", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="assethistory",
+            name="assets_asse_asset_i_a1ae76_idx",
+        ),
+        migrations.AddIndex(
+            model_name="assethistory",
+            index=models.Index(
+                fields=["asset", "-recorded_at", "source"],
+                name="asset_hist_asset_time_src_idx",
+            ),
+        ),
+    ]
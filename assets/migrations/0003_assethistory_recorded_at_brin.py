@@ -0,0 +1,33 @@
+# BRIN index on AssetHistory.recorded_at for date-range scans.
+#
+# AssetHistory is append-only, so recorded_at follows the physical row
+# order and a BRIN index prunes ranges at a fraction of a B-tree's size.
+# BRIN is PostgreSQL-only; other backends skip this migration.
+
+from django.db import migrations
+
+
+def create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX asset_hist_recorded_brin ON assets_assethistory "
+        "USING brin (recorded_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS asset_hist_recorded_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0002_remove_assethistory_assets_asse_asset_i_a1ae76_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
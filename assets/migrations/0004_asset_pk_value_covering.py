@@ -0,0 +1,30 @@
+# Covering index so Asset.save()'s fallback value lookup
+# (filter(pk=...).values_list('value')) is answered by an index-only scan.
+# INCLUDE columns are PostgreSQL-only; other backends skip this migration.
+
+from django.db import migrations
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX asset_pk_value_covering ON assets_asset (id) INCLUDE (value)"
+    )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS asset_pk_value_covering")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0003_assethistory_recorded_at_brin"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
@@ -0,0 +1,43 @@
+# Trigram GIN indexes backing the admin's substring search on Asset.name
+# and Asset.notes.
+#
+# Django compiles icontains on PostgreSQL to UPPER(col::text) LIKE UPPER(...),
+# so the indexes are built on UPPER(col) to match. Both the pg_trgm
+# extension and GIN indexes are PostgreSQL-only; other backends skip them.
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    "asset_name_trgm_idx": "name",
+    "asset_notes_trgm_idx": "notes",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX {index_name} ON assets_asset "
+            f"USING gin (UPPER({column}) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("assets", "0004_asset_pk_value_covering"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
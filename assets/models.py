@@ -2,11 +2,35 @@
 Asset tracking models for various asset types.
 """
 from django.conf import settings
-from django.db import models
+from django.db import DatabaseError, models, router
+from django.db.models.signals import post_save, pre_save
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
 
 
+class AssetType(models.TextChoices):
+    """
+    Categories of assets.
+    """
+    CASH = 'CASH', 'Cash & Bank Accounts'
+    INVESTMENT = 'INVESTMENT', 'Investment Portfolio'
+    REAL_ESTATE = 'REAL_ESTATE', 'Real Estate'
+    VEHICLE = 'VEHICLE', 'Vehicle'
+    PRECIOUS_METALS = 'PRECIOUS_METALS', 'Precious Metals'
+    CRYPTOCURRENCY = 'CRYPTOCURRENCY', 'Cryptocurrency'
+    OTHER = 'OTHER', 'Other'
+
+
+class HistorySource(models.TextChoices):
+    """
+    How an asset history value was recorded.
+    """
+    MANUAL = 'MANUAL', 'Manual Entry'
+    STATEMENT_UPLOAD = 'STATEMENT_UPLOAD', 'Statement Upload'
+    API_SYNC = 'API_SYNC', 'API Sync'
+
+
 class Asset(models.Model):
     """
     Represents a financial asset owned by a user.
@@ -33,23 +57,19 @@ class Asset(models.Model):
         last_valued_at: When value was last updated
     """
     # Asset Type Choices
-    CASH = 'CASH'
-    INVESTMENT = 'INVESTMENT'
-    REAL_ESTATE = 'REAL_ESTATE'
-    VEHICLE = 'VEHICLE'
-    PRECIOUS_METALS = 'PRECIOUS_METALS'
-    CRYPTOCURRENCY = 'CRYPTOCURRENCY'
-    OTHER = 'OTHER'
-
-    ASSET_TYPE_CHOICES = [
-        (CASH, 'Cash & Bank Accounts'),
-        (INVESTMENT, 'Investment Portfolio'),
-        (REAL_ESTATE, 'Real Estate'),
-        (VEHICLE, 'Vehicle'),
-        (PRECIOUS_METALS, 'Precious Metals'),
-        (CRYPTOCURRENCY, 'Cryptocurrency'),
-        (OTHER, 'Other'),
-    ]
+    CASH = AssetType.CASH
+    INVESTMENT = AssetType.INVESTMENT
+    REAL_ESTATE = AssetType.REAL_ESTATE
+    VEHICLE = AssetType.VEHICLE
+    PRECIOUS_METALS = AssetType.PRECIOUS_METALS
+    CRYPTOCURRENCY = AssetType.CRYPTOCURRENCY
+    OTHER = AssetType.OTHER
+
+    ASSET_TYPE_CHOICES = AssetType.choices
+    ASSET_TYPE_LABELS = dict(ASSET_TYPE_CHOICES)
+
+    # save(update_fields=...) limited to these takes the conditional UPDATE path
+    VALUE_ONLY_FIELDS = frozenset({'value', 'updated_at', 'last_valued_at'})
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -114,10 +134,22 @@ class Asset(models.Model):
             models.Index(fields=['user', 'asset_type', 'is_active']),
             models.Index(fields=['user', 'is_active', '-updated_at']),
         ]
+        # PostgreSQL also gets a covering (id) INCLUDE (value) index
+        # (migration 0004) and trigram GIN indexes on name and notes for
+        # admin search (migration 0005)
 
     def __str__(self):
         return f"{self.name} - {self.currency.code} {self.value}"
 
+    def get_asset_type_display(self):
+        """
+        Get the human-readable asset type from the precomputed label map.
+
+        Returns:
+            str: Asset type label
+        """
+        return self.ASSET_TYPE_LABELS.get(self.asset_type, self.asset_type)
+
     def get_value_in_currency(self, target_currency):
         """
         Convert asset value to target currency.
@@ -128,41 +160,143 @@ class Asset(models.Model):
         Returns:
             Decimal: Value in target currency
         """
-        if self.currency == target_currency:
+        # Compare ids so the identity case never loads self.currency
+        if self.currency_id == target_currency.pk:
             return self.value
 
-        from currencies.services import CurrencyService
+        from currencies.services import CurrencyCache, CurrencyService
+        # Resolve the source currency from the in-process cache rather than
+        # loading the foreign key
         return CurrencyService.convert(
             amount=self.value,
-            from_currency=self.currency,
+            from_currency=CurrencyCache.get_by_id(self.currency_id),
             to_currency=target_currency
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the value loaded from the database so save() can detect
+        value changes without querying the row again.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'value' in field_names:
+            instance._loaded_value = instance.value
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Keep the remembered database value in sync after a refresh.
+        """
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or 'value' in fields:
+            self._loaded_value = self.value
+
     def save(self, *args, **kwargs):
         """
         Override save to create history record on value change.
+
+        Saves restricted to value fields (see VALUE_ONLY_FIELDS) are issued
+        as a single UPDATE ... WHERE value <> %s instead.
         """
         is_new = self.pk is None
         old_value = None
 
+        update_fields = kwargs.get('update_fields')
+        if (
+            not is_new
+            and update_fields is not None
+            and 'value' in update_fields
+            and set(update_fields) <= self.VALUE_ONLY_FIELDS
+        ):
+            self._save_value_only(kwargs.get('using'), update_fields)
+            return
+
         if not is_new:
-            try:
-                old_asset = Asset.objects.get(pk=self.pk)
-                old_value = old_asset.value
-            except Asset.DoesNotExist:
-                pass
+            if hasattr(self, '_loaded_value'):
+                old_value = self._loaded_value
+            else:
+                # Instance was not loaded from the database (e.g. built with a pk);
+                # served from the (id) INCLUDE (value) index on PostgreSQL
+                old_value = Asset.objects.filter(pk=self.pk).values_list('value', flat=True).first()
 
         super().save(*args, **kwargs)
+        self._loaded_value = self.value
 
         # Create history record if value changed or new asset
-        if is_new or (old_value and old_value != self.value):
+        if is_new or (old_value is not None and old_value != self.value):
             AssetHistory.objects.create(
                 asset=self,
                 value=self.value,
-                currency=self.currency,
+                currency_id=self.currency_id,
                 source=AssetHistory.MANUAL
             )
 
+    def _save_value_only(self, using=None, update_fields=None):
+        """
+        Persist a value-only update with a single conditional UPDATE.
+
+        The row is written, and a history record created, only when the
+        stored value differs from self.value, so no-op saves cost one
+        query and never need to read the old value first. pre_save and
+        post_save are sent either way, as for a regular
+        save(update_fields=...).
+
+        Args:
+            using: Database alias to write to
+            update_fields: Fields passed to save()
+
+        Returns:
+            bool: Whether the stored value changed
+
+        Raises:
+            DatabaseError: If the value changed but the row no longer exists
+        """
+        using = using or router.db_for_write(Asset, instance=self)
+        update_fields = frozenset(update_fields or self.VALUE_ONLY_FIELDS)
+        pre_save.send(
+            sender=Asset,
+            instance=self,
+            raw=False,
+            using=using,
+            update_fields=update_fields,
+        )
+        now = timezone.now()
+        updated = Asset.objects.using(using).filter(pk=self.pk).exclude(
+            value=self.value
+        ).update(value=self.value, updated_at=now, last_valued_at=now)
+
+        if not updated:
+            # No row matched: either the value is unchanged or the row is
+            # gone. Only a save that should have changed something checks,
+            # matching Django's error for save(update_fields=...).
+            if (
+                getattr(self, '_loaded_value', None) != self.value
+                and not Asset.objects.using(using).filter(pk=self.pk).exists()
+            ):
+                raise DatabaseError("Save with update_fields did not affect any rows.")
+        else:
+            self.updated_at = now
+            self.last_valued_at = now
+            AssetHistory.objects.using(using).create(
+                asset=self,
+                value=self.value,
+                currency_id=self.currency_id,
+                source=AssetHistory.MANUAL
+            )
+        self._loaded_value = self.value
+
+        # QuerySet.update() bypasses model signals; send post_save as save() does
+        post_save.send(
+            sender=Asset,
+            instance=self,
+            created=False,
+            update_fields=update_fields,
+            raw=False,
+            using=using,
+        )
+        return bool(updated)
+
 
 class AssetHistory(models.Model):
     """
@@ -175,15 +309,12 @@ class AssetHistory(models.Model):
         recorded_at: Timestamp of this record
         source: How this value was recorded
     """
-    MANUAL = 'MANUAL'
-    STATEMENT_UPLOAD = 'STATEMENT_UPLOAD'
-    API_SYNC = 'API_SYNC'
+    MANUAL = HistorySource.MANUAL
+    STATEMENT_UPLOAD = HistorySource.STATEMENT_UPLOAD
+    API_SYNC = HistorySource.API_SYNC
 
-    SOURCE_CHOICES = [
-        (MANUAL, 'Manual Entry'),
-        (STATEMENT_UPLOAD, 'Statement Upload'),
-        (API_SYNC, 'API Sync'),
-    ]
+    SOURCE_CHOICES = HistorySource.choices
+    SOURCE_LABELS = dict(SOURCE_CHOICES)
 
     asset = models.ForeignKey(
         Asset,
@@ -218,8 +349,18 @@ class AssetHistory(models.Model):
         verbose_name_plural = "Asset Histories"
         ordering = ['-recorded_at']
         indexes = [
-            models.Index(fields=['asset', '-recorded_at']),
+            models.Index(fields=['asset', '-recorded_at', 'source'], name='asset_hist_asset_time_src_idx'),
         ]
+        # PostgreSQL also gets a BRIN index on recorded_at (migration 0003)
 
     def __str__(self):
         return f"{self.asset.name} - {self.currency.code} {self.value} at {self.recorded_at}"
+
+    def get_source_display(self):
+        """
+        Get the human-readable source from the precomputed label map.
+
+        Returns:
+            str: Source label
+        """
+        return self.SOURCE_LABELS.get(self.source, self.source)
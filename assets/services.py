@@ -1,8 +1,12 @@
 """
 Asset calculation and management services.
 """
-from decimal import Decimal
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from currencies.services import ZERO
 
 
 class AssetService:
@@ -10,32 +14,84 @@ class AssetService:
     Service layer for asset-related business logic.
     """
 
+    CACHE_TIMEOUT = 300  # 5 minutes in seconds
+    CACHE_KEY_PREFIX = 'asset_total'
+
     @staticmethod
     def calculate_total_assets(user):
         """
         Calculate total value of all active assets for a user in their home currency.
 
+        The result is cached per user for CACHE_TIMEOUT seconds and
+        invalidated whenever one of the user's assets is saved or deleted.
+
         Args:
             user: User object
 
         Returns:
             Decimal: Total asset value in user's home currency
         """
-        from assets.models import Asset
-
         home_currency = user.get_home_currency()
-        total = Decimal('0.00')
 
-        # Get all active assets for the user
-        assets = Asset.objects.filter(user=user, is_active=True)
-
-        for asset in assets:
-            # Convert each asset to home currency
-            converted_value = asset.get_value_in_currency(home_currency)
-            total += converted_value
+        cache_key = f"{AssetService.CACHE_KEY_PREFIX}_{user.pk}"
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == home_currency.pk:
+            return cached[1]
 
+        total = AssetService._sum_assets_in_currency(user, home_currency)
+        cache.set(cache_key, (home_currency.pk, total), AssetService.CACHE_TIMEOUT)
         return total
 
+    @staticmethod
+    def invalidate_total_assets(user_id):
+        """
+        Drop the cached asset total for a user.
+
+        Args:
+            user_id: ID of the user whose assets changed
+        """
+        cache.delete(f"{AssetService.CACHE_KEY_PREFIX}_{user_id}")
+
+    @staticmethod
+    def _sum_assets_in_currency(user, home_currency):
+        """
+        Sum a user's active assets converted into home_currency.
+
+        Args:
+            user: User object
+            home_currency: Currency object to convert into
+
+        Returns:
+            Decimal: Total asset value in home_currency
+        """
+        from assets.models import Asset
+        from currencies.services import CurrencyService
+
+        assets = Asset.objects.filter(user=user, is_active=True)
+
+        currency_ids = assets.order_by().values_list('currency_id', flat=True).distinct()
+        rates = CurrencyService.bulk_get_exchange_rates(currency_ids, home_currency)
+
+        # Convert and sum in the database; values without a known rate are
+        # counted unconverted, as CurrencyService.convert() does
+        converted_value = Case(
+            *[
+                When(currency_id=currency_id, then=F('value') * Value(rate))
+                for currency_id, rate in rates.items()
+                if rate is not None
+            ],
+            default=F('value'),
+            output_field=DecimalField(max_digits=30, decimal_places=10)
+        )
+
+        return assets.aggregate(
+            total=Coalesce(
+                Sum(converted_value),
+                Value(ZERO),
+                output_field=DecimalField(max_digits=30, decimal_places=10)
+            )
+        )['total']
+
     @staticmethod
     def get_assets_by_type(user, asset_type=None):
         """
@@ -69,15 +125,26 @@ class AssetService:
             dict: Dictionary with asset types as keys and total values as values
         """
         from assets.models import Asset
+        from currencies.services import CurrencyService
 
         home_currency = user.get_home_currency()
         breakdown = {}
 
-        assets = Asset.objects.filter(user=user, is_active=True)
+        # Sum active assets per (type, currency) in a single GROUP BY query
+        subtotals = list(
+            Asset.objects.filter(
+                user=user,
+                is_active=True
+            ).values('asset_type', 'currency_id').annotate(subtotal=Sum('value'))
+        )
+
+        converted = CurrencyService.convert_many(
+            [(row['subtotal'], row['currency_id']) for row in subtotals],
+            home_currency
+        )
 
-        for asset in assets:
-            asset_type = asset.asset_type
-            converted_value = asset.get_value_in_currency(home_currency)
+        for row, converted_value in zip(subtotals, converted):
+            asset_type = row['asset_type']
 
             if asset_type in breakdown:
                 breakdown[asset_type] += converted_value
@@ -85,3 +152,60 @@ class AssetService:
                 breakdown[asset_type] = converted_value
 
         return breakdown
+
+    @staticmethod
+    def bulk_apply_values(user, updates):
+        """
+        Apply new values to several of a user's assets at once.
+
+        Changed assets are written with one bulk UPDATE and their history
+        records with one bulk INSERT. Asset.save() is bypassed, so history
+        is recorded here instead.
+
+        Args:
+            user: User object owning the assets
+            updates: List of (asset_id, new_value, source) tuples, where
+                new_value is a Decimal and source an AssetHistory source
+
+        Returns:
+            int: Number of assets whose value changed
+        """
+        from assets.models import Asset, AssetHistory
+
+        # Only the columns compared or copied into history are loaded
+        assets = Asset.objects.filter(user=user).only('value', 'currency_id').in_bulk(
+            [asset_id for asset_id, _, _ in updates]
+        )
+        now = timezone.now()
+        changed = {}
+        history = []
+
+        for asset_id, new_value, source in updates:
+            asset = assets.get(asset_id)
+            if asset is None or asset.value == new_value:
+                continue
+
+            asset.value = new_value
+            asset.updated_at = now
+            asset.last_valued_at = now
+            changed[asset_id] = asset
+            history.append(AssetHistory(
+                asset=asset,
+                value=new_value,
+                currency_id=asset.currency_id,
+                source=source
+            ))
+
+        with transaction.atomic():
+            Asset.objects.bulk_update(
+                changed.values(),
+                ['value', 'updated_at', 'last_valued_at'],
+                batch_size=500
+            )
+            AssetHistory.objects.bulk_create(history, batch_size=500)
+
+        # bulk_update() does not send post_save, so drop the cached total here
+        if changed:
+            AssetService.invalidate_total_assets(user.pk)
+
+        return len(changed)
@@ -0,0 +1,17 @@
+"""
+Signal handlers for asset models.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Asset
+from .services import AssetService
+
+
+@receiver([post_save, post_delete], sender=Asset)
+def invalidate_asset_total(sender, instance, **kwargs):
+    """
+    Drop the owner's cached asset total when an asset is saved or deleted.
+
+    AssetHistory changes are ignored; they do not affect the total.
+    """
+    AssetService.invalidate_total_assets(instance.user_id)
@@ -17,6 +17,14 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
+# Exchange rate updates spend nearly all their time waiting on the API and
+# the database, so they get their own queue for a thread-pool worker:
+#   celery -A config worker -Q io --pool=threads --concurrency=50
+app.conf.task_routes = {
+    'currencies.tasks.update_exchange_rates': {'queue': 'io'},
+    'currencies.tasks.update_exchange_rates_for_currencies': {'queue': 'io'},
+}
+
 # Celery Beat schedule for periodic tasks
 app.conf.beat_schedule = {
     'update-exchange-rates-daily': {
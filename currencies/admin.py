@@ -3,11 +3,28 @@ Admin configuration for Currency and ExchangeRate models.
 """
 from django.contrib import admin
 from django.contrib import messages
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 from .models import Currency, ExchangeRate
 from .services import CurrencyService
 
 
+class ExchangeRateChangeList(ChangeList):
+    """
+    Changelist that loads only the columns rendered in the exchange rate list.
+    """
+    LIST_FIELDS = [
+        'rate', 'date', 'source', 'created_at',
+        'from_currency__code', 'from_currency__name',
+        'to_currency__code', 'to_currency__name',
+    ]
+
+    def get_queryset(self, request, exclude_parameters=None):
+        """Skip the unused columns of the joined currencies."""
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(*self.LIST_FIELDS)
+
+
 @admin.register(Currency)
 class CurrencyAdmin(admin.ModelAdmin):
     """
@@ -45,6 +62,7 @@ class ExchangeRateAdmin(admin.ModelAdmin):
     You can manually refresh rates using the "Update Exchange Rates" action below.
     """
     list_display = ['from_currency', 'to_currency', 'rate', 'date', 'source', 'created_at']
+    list_select_related = ['from_currency', 'to_currency']
     list_filter = ['from_currency', 'to_currency', 'date', 'source']
     search_fields = ['from_currency__code', 'to_currency__code']
     ordering = ['-date', 'from_currency', 'to_currency']
@@ -76,6 +94,10 @@ class ExchangeRateAdmin(admin.ModelAdmin):
         )
         return super().changelist_view(request, extra_context=extra_context)
 
+    def get_changelist(self, request, **kwargs):
+        """Use the column-restricted changelist."""
+        return ExchangeRateChangeList
+
     def update_exchange_rates_now(self, request, queryset):
         """
         Admin action to manually update exchange rates from API.
@@ -0,0 +1,38 @@
+# Replace the (from_currency, to_currency, -date) index with a covering
+# index so rate lookups, which read from_currency_id, to_currency_id, date
+# and rate, are answered by index-only scans.
+#
+# INCLUDE columns are PostgreSQL-only; on other backends the unique_together
+# index on (from_currency, to_currency, date) serves the same lookups.
+
+from django.db import migrations
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX er_point_idx ON currencies_exchangerate "
+        "(from_currency_id, to_currency_id, date) INCLUDE (rate)"
+    )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS er_point_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("currencies", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="exchangerate",
+            name="currencies__from_cu_c1a64b_idx",
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("currencies", "0002_exchangerate_rate_covering_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="currency",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["code"],
+                name="currency_active_code_idx",
+            ),
+        ),
+    ]
@@ -40,6 +40,14 @@ class Currency(models.Model):
         verbose_name = "Currency"
         verbose_name_plural = "Currencies"
         ordering = ['code']
+        indexes = [
+            # Active currencies ordered by code for the currency dropdown
+            models.Index(
+                fields=['code'],
+                name='currency_active_code_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.code} - {self.name}"
@@ -56,6 +64,9 @@ class ExchangeRate(models.Model):
         date: Date for which this rate is valid
         source: API source that provided this rate
     """
+    # Columns loaded by the rate lookup helpers; source and created_at are deferred
+    LOOKUP_FIELDS = ('from_currency', 'to_currency', 'rate', 'date')
+
     from_currency = models.ForeignKey(
         Currency,
         on_delete=models.CASCADE,
@@ -90,9 +101,9 @@ class ExchangeRate(models.Model):
         verbose_name_plural = "Exchange Rates"
         ordering = ['-date', 'from_currency', 'to_currency']
         unique_together = ['from_currency', 'to_currency', 'date']
-        indexes = [
-            models.Index(fields=['from_currency', 'to_currency', '-date']),
-        ]
+        # The unique_together index already serves (from, to, date) lookups in
+        # either date direction. PostgreSQL additionally gets a covering index
+        # INCLUDE (rate) for index-only rate lookups (migration 0002).
 
     def __str__(self):
         return f"{self.from_currency.code}/{self.to_currency.code} = {self.rate} ({self.date})"
@@ -112,7 +123,7 @@ class ExchangeRate(models.Model):
         return ExchangeRate.objects.filter(
             from_currency=from_currency,
             to_currency=to_currency
-        ).order_by('-date').first()
+        ).order_by('-date').only(*ExchangeRate.LOOKUP_FIELDS).first()
 
     @staticmethod
     def get_rate_for_date(from_currency, to_currency, date):
@@ -131,4 +142,4 @@ class ExchangeRate(models.Model):
             from_currency=from_currency,
             to_currency=to_currency,
             date=date
-        ).first()
+        ).order_by('pk').only(*ExchangeRate.LOOKUP_FIELDS).first()
@@ -1,17 +1,169 @@
 """
 Currency and Exchange Rate services for fetching and converting currencies.
 """
+from concurrent.futures import ThreadPoolExecutor
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from decimal import Decimal
 from datetime import date, timedelta
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 from .models import Currency, ExchangeRate
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Rate of a currency to itself; shared instead of parsed on every call
+_ONE = Decimal('1.0')
+
+# Zero amount at money precision, shared by the aggregation code in the
+# assets, liabilities and networth apps
+ZERO = Decimal('0.00')
+
+# Cached in place of a rate for pairs that have none, so repeated lookups
+# of a missing pair don't reload every rate into the target currency.
+# A real exchange rate is never zero.
+_MISSING_RATE = 0
+
+# Process-local memo for CurrencyService.get_rate():
+# {(from_id, to_id, date): (expires_at, rate)}
+# Threaded workers (the io Celery pool, threaded web servers) share it, so
+# every read and write goes through _RATE_MEMO_LOCK
+_RATE_MEMO = {}
+_RATE_MEMO_LOCK = threading.Lock()
+
+# Most base currencies fetched concurrently by update_all_exchange_rates()
+MAX_FETCH_WORKERS = 8
+
+# Shared HTTP session so repeated API calls reuse pooled keep-alive
+# connections instead of opening a new TCP/TLS connection each time.
+# The API is a single host, so one pool sized to the concurrent fetch
+# workers is enough.
+_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_FETCH_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+)
+# EXCHANGE_RATE_API_URL is configurable and may be plain http
+_SESSION.mount('https://', _HTTP_ADAPTER)
+_SESSION.mount('http://', _HTTP_ADAPTER)
+
+
+class CurrencyCache:
+    """
+    Process-wide map of the Currency table, keyed by code and by id.
+
+    The whole table (a few hundred rows at most) is loaded with one query on
+    first use rather than in AppConfig.ready(), where database access is
+    discouraged and the table may not exist yet during migrate. It is
+    dropped by CurrencyService.clear_currency_cache() whenever a currency is
+    saved, deleted or bulk created, and reloaded on next use. Currencies
+    created by another process are picked up on a miss; edits made by
+    another process are picked up once the maps are older than TIMEOUT.
+    """
+    TIMEOUT = 3600  # 1 hour in seconds
+    _maps = None
+    _loaded_at = 0.0
+
+    @classmethod
+    def _get_maps(cls):
+        """
+        Get the (by_code, by_id) maps, loading them if needed.
+
+        Returns:
+            tuple: ({code: Currency}, {id: Currency})
+        """
+        maps = cls._maps
+        if maps is None or time.monotonic() - cls._loaded_at > cls.TIMEOUT:
+            currencies = list(Currency.objects.all())
+            maps = (
+                {currency.code: currency for currency in currencies},
+                {currency.pk: currency for currency in currencies},
+            )
+            cls._maps = maps
+            cls._loaded_at = time.monotonic()
+        return maps
+
+    @classmethod
+    def _add(cls, currency):
+        """Add a currency found by a fallback query to the loaded maps."""
+        by_code, by_id = cls._get_maps()
+        by_code[currency.code] = currency
+        by_id[currency.pk] = currency
+
+    @classmethod
+    def get_by_code(cls, code):
+        """
+        Get a Currency by code.
+
+        Args:
+            code: Currency code (e.g., USD, EUR)
+
+        Returns:
+            Currency object or None if not found
+        """
+        currency = cls._get_maps()[0].get(code)
+        if currency is None:
+            currency = Currency.objects.filter(code=code).first()
+            if currency is not None:
+                cls._add(currency)
+        return currency
+
+    @classmethod
+    def get_by_id(cls, currency_id):
+        """
+        Get a Currency by primary key.
+
+        Args:
+            currency_id: Currency ID
+
+        Returns:
+            Currency object or None if not found
+        """
+        currency = cls._get_maps()[1].get(currency_id)
+        if currency is None:
+            currency = Currency.objects.filter(pk=currency_id).first()
+            if currency is not None:
+                cls._add(currency)
+        return currency
+
+    @classmethod
+    def all(cls):
+        """
+        Get all loaded currencies.
+
+        Returns:
+            list: Currency objects
+        """
+        return list(cls._get_maps()[1].values())
+
+    @classmethod
+    def ids(cls):
+        """
+        Get the IDs of all loaded currencies.
+
+        Returns:
+            list: Currency IDs
+        """
+        return list(cls._get_maps()[1])
+
+    @classmethod
+    def clear(cls):
+        """Drop the loaded maps; they are reloaded on next use."""
+        cls._maps = None
+
 
 class CurrencyService:
     """
@@ -23,17 +175,35 @@ class CurrencyService:
 
     CACHE_TIMEOUT = 86400  # 24 hours in seconds
     CACHE_KEY_PREFIX = 'exchange_rate'
+    MATRIX_CACHE_KEY_PREFIX = 'rate_matrix'
+    RATE_VERSION_KEY_PREFIX = 'exchange_rate_version'
+    RATE_FALLBACK_DAYS = 7
+    UPSERT_BATCH_SIZE = 500
+    API_RESPONSE_CACHE_KEY_PREFIX = 'exchange_rate_api_response'
+    API_RESPONSE_CACHE_TIMEOUT = 604800  # 7 days in seconds
+    RATE_LIMIT_KEY_PREFIX = 'exchange_rate_api_calls'
+    RATE_LIMIT_WINDOW = 60  # 1 minute in seconds
+    RATE_LIMIT_MAX_CALLS = 30
+    RATE_LIMIT_MAX_WAIT = 60  # seconds a fetch may wait for the next window
+    RATE_MEMO_TIMEOUT = 300  # 5 minutes in seconds
+    RATE_MEMO_MAX_SIZE = 1024
+    MISSING_RATE_CACHE_TIMEOUT = 300  # 5 minutes in seconds
+    ACTIVE_CODES_CACHE_KEY = 'active_currency_codes'
+    ACTIVE_CODES_CACHE_TIMEOUT = 3600  # 1 hour in seconds
 
     @staticmethod
-    def fetch_exchange_rates(base_currency='USD'):
+    def fetch_exchange_rates(base_currency='USD', wait=False):
         """
         Fetch exchange rates from ExchangeRate-API for a base currency.
 
         Args:
             base_currency: Base currency code (default: USD)
+            wait: Whether to wait for the next rate limit window when the
+                current one is used up, instead of giving up (background tasks only)
 
         Returns:
-            dict: Dictionary of exchange rates or None if failed
+            dict: Dictionary of exchange rates or None if failed. Fractional
+            rates are parsed as Decimal.
 
         Example response:
         {
@@ -48,15 +218,45 @@ class CurrencyService:
             }
         }
         """
+        if not CurrencyService._acquire_rate_limit(wait):
+            logger.warning(f"Exchange rate API call limit reached, skipping fetch for {base_currency}")
+            return None
+
         url = f"{settings.EXCHANGE_RATE_API_URL}/{base_currency}"
 
+        # Revalidate the last response instead of downloading it again
+        response_cache_key = f"{CurrencyService.API_RESPONSE_CACHE_KEY_PREFIX}_{base_currency}"
+        cached_response = cache.get(response_cache_key)
+        headers = {}
+        if cached_response is not None:
+            etag, last_modified, _ = cached_response
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         try:
-            response = requests.get(url, timeout=10)
+            response = _SESSION.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+
+            if response.status_code == 304 and cached_response is not None:
+                logger.info(f"Exchange rates for {base_currency} not modified since last fetch")
+                return cached_response[2]
+
+            # Parse the raw body directly (no Response.text decoding step), with
+            # rates going straight to Decimal instead of float -> str -> Decimal
+            data = json.loads(response.content, parse_float=Decimal)
 
             if data.get('result') == 'success':
                 logger.info(f"Successfully fetched exchange rates for {base_currency}")
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    cache.set(
+                        response_cache_key,
+                        (etag, last_modified, data),
+                        CurrencyService.API_RESPONSE_CACHE_TIMEOUT
+                    )
                 return data
             else:
                 logger.error(f"API returned error: {data.get('error-type', 'Unknown error')}")
@@ -66,66 +266,148 @@ class CurrencyService:
             logger.error(f"Failed to fetch exchange rates: {str(e)}")
             return None
 
+        except ValueError as e:
+            logger.error(f"Invalid JSON in exchange rate response: {str(e)}")
+            return None
+
+    @staticmethod
+    def _check_rate_limit():
+        """
+        Count one API call against the current rate limit window.
+
+        The window's counter is created with cache.add() and bumped with
+        cache.incr(). Both are atomic on Redis, so concurrent workers can't
+        lose or double count calls the way a get-then-set would.
+
+        Returns:
+            bool: True if the call is allowed, False if the limit is reached
+        """
+        window = int(time.time()) // CurrencyService.RATE_LIMIT_WINDOW
+        cache_key = f"{CurrencyService.RATE_LIMIT_KEY_PREFIX}_{window}"
+
+        cache.add(cache_key, 0, CurrencyService.RATE_LIMIT_WINDOW)
+        try:
+            calls = cache.incr(cache_key)
+        except ValueError:
+            # Counter was evicted between add() and incr()
+            cache.add(cache_key, 1, CurrencyService.RATE_LIMIT_WINDOW)
+            calls = 1
+
+        return calls <= CurrencyService.RATE_LIMIT_MAX_CALLS
+
+    @staticmethod
+    def _acquire_rate_limit(wait=False):
+        """
+        Take a slot under the API rate limit.
+
+        When the current window is used up and wait is set, sleeps until the
+        next window starts, for at most RATE_LIMIT_MAX_WAIT seconds in total,
+        rather than sending a request that would come back as a 429.
+        Interactive callers leave wait unset and fail fast.
+
+        Args:
+            wait: Whether to sleep until a slot frees up
+
+        Returns:
+            bool: True if the call may proceed, False if no slot was freed in time
+        """
+        waited = 0
+        while not CurrencyService._check_rate_limit():
+            if not wait:
+                return False
+            delay = CurrencyService.RATE_LIMIT_WINDOW - time.time() % CurrencyService.RATE_LIMIT_WINDOW
+            if waited + delay > CurrencyService.RATE_LIMIT_MAX_WAIT:
+                return False
+            logger.info(f"Exchange rate API call limit reached, waiting {delay:.1f}s for the next window")
+            time.sleep(delay)
+            waited += delay
+        return True
+
     @staticmethod
-    def update_exchange_rates_for_currency(base_currency_code='USD'):
+    def update_exchange_rates_for_currency(base_currency_code='USD', data=None):
         """
         Fetch and store exchange rates for a specific base currency.
 
         Args:
             base_currency_code: Base currency code to fetch rates for
+            data: Response already returned by fetch_exchange_rates() for
+                this base; fetched here when omitted
 
         Returns:
             tuple: (success: bool, message: str, rates_updated: int)
         """
         try:
-            # Get or create base currency
-            base_currency, _ = Currency.objects.get_or_create(
-                code=base_currency_code,
-                defaults={
-                    'name': f'{base_currency_code} Currency',
-                    'symbol': base_currency_code,
-                    'is_active': True
-                }
-            )
-
             # Fetch rates from API
-            data = CurrencyService.fetch_exchange_rates(base_currency_code)
+            if data is None:
+                data = CurrencyService.fetch_exchange_rates(base_currency_code)
 
             if not data or 'rates' not in data:
                 return False, "Failed to fetch exchange rates from API", 0
 
-            rates = data['rates']
             today = date.today()
-            rates_updated = 0
-
-            # Store each exchange rate
-            for target_code, rate_value in rates.items():
-                # Get or create target currency
-                target_currency, _ = Currency.objects.get_or_create(
-                    code=target_code,
-                    defaults={
-                        'name': f'{target_code} Currency',
-                        'symbol': target_code,
-                        'is_active': True
-                    }
-                )
+            # Prepare values up front so the transaction only runs queries.
+            # The base-to-base rate is always 1 and get_exchange_rate()
+            # short-circuits same-currency lookups, so it is never stored.
+            rates = {
+                code: Decimal(rate_value)
+                for code, rate_value in data['rates'].items()
+                if code != base_currency_code
+            }
+            # The base currency is resolved together with the targets
+            codes = set(rates) | {base_currency_code}
+            new_currencies = {
+                code: Currency(code=code, name=f'{code} Currency', symbol=code, is_active=True)
+                for code in codes
+            }
 
-                # Create or update exchange rate
-                exchange_rate, created = ExchangeRate.objects.update_or_create(
-                    from_currency=base_currency,
-                    to_currency=target_currency,
-                    date=today,
-                    defaults={
-                        'rate': Decimal(str(rate_value)),
-                        'source': 'exchangerate-api'
-                    }
+            with transaction.atomic():
+                # Resolve base and target currencies, creating any we have not seen yet
+                currencies = Currency.objects.in_bulk(list(codes), field_name='code')
+                missing = codes - currencies.keys()
+                if missing:
+                    Currency.objects.bulk_create(
+                        [new_currencies[code] for code in missing],
+                        ignore_conflicts=True,
+                        batch_size=CurrencyService.UPSERT_BATCH_SIZE
+                    )
+                    # bulk_create() sends no post_save signals
+                    transaction.on_commit(CurrencyService.clear_currency_cache)
+                    currencies.update(Currency.objects.in_bulk(list(missing), field_name='code'))
+
+                # Insert or update the exchange rates, UPSERT_BATCH_SIZE rows per statement
+                ExchangeRate.objects.bulk_create(
+                    [
+                        ExchangeRate(
+                            from_currency_id=currencies[base_currency_code].pk,
+                            to_currency_id=currencies[target_code].pk,
+                            date=today,
+                            rate=rate_value,
+                            source='exchangerate-api'
+                        )
+                        for target_code, rate_value in rates.items()
+                    ],
+                    update_conflicts=True,
+                    update_fields=['rate', 'source'],
+                    unique_fields=['from_currency', 'to_currency', 'date'],
+                    batch_size=CurrencyService.UPSERT_BATCH_SIZE
                 )
 
-                # Cache the rate
-                cache_key = f"{CurrencyService.CACHE_KEY_PREFIX}_{base_currency_code}_{target_code}_{today}"
-                cache.set(cache_key, rate_value, CurrencyService.CACHE_TIMEOUT)
+                # Once committed (immediately, outside an outer transaction),
+                # retire every rate cached for today, then cache the new ones
+                def refresh_cache():
+                    CurrencyService.invalidate_rate_cache(today)
+                    version = CurrencyService._rate_cache_version(today)
+                    cache.set_many(
+                        {
+                            CurrencyService._rate_cache_key(base_currency_code, target_code, today, version): rate_value
+                            for target_code, rate_value in rates.items()
+                        },
+                        CurrencyService.CACHE_TIMEOUT
+                    )
+
+                transaction.on_commit(refresh_cache)
 
-                rates_updated += 1
+            rates_updated = len(rates)
 
             logger.info(f"Updated {rates_updated} exchange rates for {base_currency_code}")
             return True, f"Successfully updated {rates_updated} exchange rates", rates_updated
@@ -135,12 +417,14 @@ class CurrencyService:
             return False, f"Error: {str(e)}", 0
 
     @staticmethod
-    def update_all_exchange_rates(base_currencies=None):
+    def update_all_exchange_rates(base_currencies=None, wait=False):
         """
         Update exchange rates for multiple base currencies.
 
         Args:
             base_currencies: List of currency codes to update. If None, uses USD only.
+            wait: Whether fetches wait for the next rate limit window when
+                the current one is used up (see fetch_exchange_rates())
 
         Returns:
             dict: Summary of updates {currency: (success, message, count)}
@@ -150,8 +434,27 @@ class CurrencyService:
 
         results = {}
 
+        if not base_currencies:
+            return results
+
+        # Fetching is pure network I/O, so all bases are fetched concurrently.
+        # The DB writes then run one base at a time on this thread's connection.
+        max_workers = min(MAX_FETCH_WORKERS, len(base_currencies))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = dict(zip(
+                base_currencies,
+                executor.map(
+                    lambda code: CurrencyService.fetch_exchange_rates(code, wait=wait),
+                    base_currencies
+                )
+            ))
+
         for currency_code in base_currencies:
-            success, message, count = CurrencyService.update_exchange_rates_for_currency(currency_code)
+            data = responses[currency_code]
+            if data is None:
+                success, message, count = False, "Failed to fetch exchange rates from API", 0
+            else:
+                success, message, count = CurrencyService.update_exchange_rates_for_currency(currency_code, data)
             results[currency_code] = {
                 'success': success,
                 'message': message,
@@ -173,62 +476,388 @@ class CurrencyService:
         Returns:
             Decimal: Exchange rate or None if not found
         """
+        # Same currency, decided before any lookups
+        if CurrencyService._currency_code(from_currency) == CurrencyService._currency_code(to_currency):
+            return _ONE
+
         # Convert to Currency objects if strings provided
         if isinstance(from_currency, str):
-            try:
-                from_currency = Currency.objects.get(code=from_currency)
-            except Currency.DoesNotExist:
+            currency = CurrencyCache.get_by_code(from_currency)
+            if currency is None:
                 logger.warning(f"Currency {from_currency} not found")
                 return None
+            from_currency = currency
 
         if isinstance(to_currency, str):
-            try:
-                to_currency = Currency.objects.get(code=to_currency)
-            except Currency.DoesNotExist:
+            currency = CurrencyCache.get_by_code(to_currency)
+            if currency is None:
                 logger.warning(f"Currency {to_currency} not found")
                 return None
+            to_currency = currency
 
         # Same currency
         if from_currency == to_currency:
-            return Decimal('1.0')
+            return _ONE
 
         # Use today if no date specified
         if date_obj is None:
             date_obj = date.today()
 
         # Try cache first
-        cache_key = f"{CurrencyService.CACHE_KEY_PREFIX}_{from_currency.code}_{to_currency.code}_{date_obj}"
-        cached_rate = cache.get(cache_key)
-        if cached_rate:
-            return Decimal(str(cached_rate))
-
-        # Try direct rate from database
-        rate = ExchangeRate.get_rate_for_date(from_currency, to_currency, date_obj)
-
-        if rate:
-            # Cache it
-            cache.set(cache_key, float(rate.rate), CurrencyService.CACHE_TIMEOUT)
-            return rate.rate
-
-        # Try inverse rate
-        inverse_rate = ExchangeRate.get_rate_for_date(to_currency, from_currency, date_obj)
-        if inverse_rate and inverse_rate.rate > 0:
-            calculated_rate = Decimal('1.0') / inverse_rate.rate
-            cache.set(cache_key, float(calculated_rate), CurrencyService.CACHE_TIMEOUT)
-            return calculated_rate
-
-        # Try to find rate for a recent date (within last 7 days)
-        for days_back in range(1, 8):
-            past_date = date_obj - timedelta(days=days_back)
-            rate = ExchangeRate.get_rate_for_date(from_currency, to_currency, past_date)
-            if rate:
-                logger.info(f"Using rate from {past_date} for {from_currency.code}/{to_currency.code}")
-                cache.set(cache_key, float(rate.rate), CurrencyService.CACHE_TIMEOUT)
-                return rate.rate
+        version = CurrencyService._rate_cache_version(date_obj)
+        cached_rate = cache.get(
+            CurrencyService._rate_cache_key(from_currency.code, to_currency.code, date_obj, version)
+        )
+        if cached_rate is not None:
+            if cached_rate == _MISSING_RATE:
+                return None
+            return CurrencyService._cached_rate_to_decimal(cached_rate)
+
+        # Load and cache every known currency's rate into to_currency in one
+        # query, so later conversions into the same currency hit the cache
+        rate = CurrencyService.warm_rate_cache(to_currency, date_obj).get(from_currency.pk)
+
+        if rate is not None:
+            return rate
 
         logger.warning(f"No exchange rate found for {from_currency.code} to {to_currency.code} on {date_obj}")
         return None
 
+    @staticmethod
+    def warm_rate_cache(to_currency, date_obj=None):
+        """
+        Cache the rates from every known currency into one target currency.
+
+        All rates are resolved with one query (see _query_rates()) and
+        written with one set_many(). Currencies without a rate are cached
+        as missing for MISSING_RATE_CACHE_TIMEOUT seconds.
+
+        Args:
+            to_currency: Target Currency object
+            date_obj: Date object (default: today)
+
+        Returns:
+            dict: {from_currency_id: Decimal rate} for the rates that were found
+        """
+        if date_obj is None:
+            date_obj = date.today()
+
+        from_ids = {
+            currency_id for currency_id in CurrencyCache.ids()
+            if currency_id != to_currency.pk
+        }
+        version = CurrencyService._rate_cache_version(date_obj)
+        rates = CurrencyService._query_rates(from_ids, to_currency, date_obj)
+
+        def cache_key(currency_id):
+            return CurrencyService._rate_cache_key(
+                CurrencyCache.get_by_id(currency_id).code, to_currency.code, date_obj, version
+            )
+
+        cache.set_many(
+            {cache_key(currency_id): rate for currency_id, rate in rates.items()},
+            CurrencyService.CACHE_TIMEOUT
+        )
+        missing = from_ids - rates.keys()
+        if missing:
+            cache.set_many(
+                {cache_key(currency_id): _MISSING_RATE for currency_id in missing},
+                CurrencyService.MISSING_RATE_CACHE_TIMEOUT
+            )
+        return rates
+
+    @staticmethod
+    def get_rate(from_currency_id, to_currency_id, date_obj=None):
+        """
+        Get an exchange rate by currency IDs, memoized in this process.
+
+        Repeated conversions of the same pair (e.g. one per liability) are
+        answered from memory for RATE_MEMO_TIMEOUT seconds instead of going
+        to the shared cache or database each time. The memo is dropped when
+        rates are stored or invalidated in this process; other processes
+        see changes once their entries expire.
+
+        Args:
+            from_currency_id: Source Currency ID
+            to_currency_id: Target Currency ID
+            date_obj: Date object (default: today)
+
+        Returns:
+            Decimal: Exchange rate or None if not found
+        """
+        if from_currency_id == to_currency_id:
+            return _ONE
+
+        if date_obj is None:
+            date_obj = date.today()
+
+        key = (from_currency_id, to_currency_id, date_obj)
+        now = time.monotonic()
+        with _RATE_MEMO_LOCK:
+            memoized = _RATE_MEMO.get(key)
+        if memoized is not None and memoized[0] > now:
+            return memoized[1]
+
+        from_currency = CurrencyCache.get_by_id(from_currency_id)
+        to_currency = CurrencyCache.get_by_id(to_currency_id)
+        if from_currency is None or to_currency is None:
+            return None
+
+        rate = CurrencyService.get_exchange_rate(from_currency, to_currency, date_obj)
+        # Misses are not memoized, so a rate stored by another process is
+        # picked up on the next call
+        if rate is None:
+            return None
+
+        # Re-insert refreshed keys at the end; when full, evict the oldest
+        # entry (dicts keep insertion order) rather than the whole memo.
+        # The lock keeps a concurrent eviction from removing the same entry
+        # or resizing the dict while it is iterated.
+        with _RATE_MEMO_LOCK:
+            _RATE_MEMO.pop(key, None)
+            if len(_RATE_MEMO) >= CurrencyService.RATE_MEMO_MAX_SIZE:
+                del _RATE_MEMO[next(iter(_RATE_MEMO))]
+            _RATE_MEMO[key] = (now + CurrencyService.RATE_MEMO_TIMEOUT, rate)
+        return rate
+
+    @staticmethod
+    def clear_rate_memo():
+        """
+        Drop the process-local rates memoized by get_rate().
+        """
+        with _RATE_MEMO_LOCK:
+            _RATE_MEMO.clear()
+
+    @staticmethod
+    def get_exchange_rate_float(from_currency, to_currency, date_obj=None):
+        """
+        Get exchange rate between two currencies as a float.
+
+        For display-only calculations (charts, approximate figures) where
+        float arithmetic is acceptable. Totals and anything stored must keep
+        using get_exchange_rate() and Decimal.
+
+        Args:
+            from_currency: Source Currency object or code
+            to_currency: Target Currency object or code
+            date_obj: Date object (default: today)
+
+        Returns:
+            float: Exchange rate or None if not found
+        """
+        rate = CurrencyService.get_exchange_rate(from_currency, to_currency, date_obj)
+        if rate is None:
+            return None
+        return float(rate)
+
+    @staticmethod
+    def _currency_code(currency):
+        """
+        Get the currency code of a Currency object or code string.
+
+        Args:
+            currency: Currency object or code
+
+        Returns:
+            str: Upper-case currency code
+        """
+        if isinstance(currency, str):
+            return currency.upper()
+        return currency.code
+
+    @staticmethod
+    def _cached_rate_to_decimal(cached_rate):
+        """
+        Turn a cached exchange rate back into a Decimal.
+
+        Rates are cached as Decimal; entries written as floats by older code
+        are converted through str() to avoid binary float noise.
+
+        Args:
+            cached_rate: Value read from the cache
+
+        Returns:
+            Decimal: Exchange rate
+        """
+        if isinstance(cached_rate, Decimal):
+            return cached_rate
+        return Decimal(str(cached_rate))
+
+    @staticmethod
+    def _query_rates(from_ids, to_currency, date_obj):
+        """
+        Look up rates from several currencies into one target with one query.
+
+        Precedence per source currency: direct rate for the date, then the
+        inverse rate for the date, then the most recent direct rate within
+        the last RATE_FALLBACK_DAYS days.
+
+        Args:
+            from_ids: Set of source Currency IDs (excluding to_currency)
+            to_currency: Target Currency object
+            date_obj: Date object
+
+        Returns:
+            dict: {from_currency_id: Decimal rate} for the rates that were found
+        """
+        # Direct and inverse rates as a UNION ALL rather than an OR, so each
+        # side is a plain range scan on the unique_together (from_currency,
+        # to_currency, date) index. order_by() drops the default ordering,
+        # which joins currencies.
+        fields = ('from_currency_id', 'to_currency_id', 'rate', 'date')
+        direct_rows = ExchangeRate.objects.filter(
+            from_currency_id__in=from_ids,
+            to_currency=to_currency,
+            date__range=(date_obj - timedelta(days=CurrencyService.RATE_FALLBACK_DAYS), date_obj)
+        ).order_by().values_list(*fields)
+        inverse_rows = ExchangeRate.objects.filter(
+            from_currency=to_currency,
+            to_currency_id__in=from_ids,
+            date=date_obj
+        ).order_by().values_list(*fields)
+        rows = direct_rows.union(inverse_rows, all=True)
+
+        direct = {}
+        inverse = {}
+        recent = {}
+        for from_id, to_id, rate, rate_date in rows:
+            if from_id == to_currency.pk:
+                if rate > 0:
+                    inverse[to_id] = _ONE / rate
+            elif rate_date == date_obj:
+                direct[from_id] = rate
+            elif from_id not in recent or rate_date > recent[from_id][0]:
+                recent[from_id] = (rate_date, rate)
+
+        found = {currency_id: rate for currency_id, (_, rate) in recent.items()}
+        found.update(inverse)
+        found.update(direct)
+
+        # Rates are stored from a few base currencies only, so cross rates
+        # (e.g. EUR -> GBP with a USD base) have to be derived
+        missing = from_ids - found.keys()
+        if missing:
+            found.update(CurrencyService._triangulate_rates(missing, to_currency, date_obj))
+
+        return found
+
+    @staticmethod
+    def _triangulate_rates(from_ids, to_currency, date_obj):
+        """
+        Derive cross rates through a shared base currency with one query.
+
+        For a base X quoting both legs on the same date,
+        rate(A -> T) = rate(X -> T) / rate(X -> A). The most recent date
+        within RATE_FALLBACK_DAYS where both legs exist is used.
+
+        Args:
+            from_ids: Set of source Currency IDs without a direct or inverse rate
+            to_currency: Target Currency object
+            date_obj: Date object
+
+        Returns:
+            dict: {from_currency_id: Decimal rate} for the rates that could be derived
+        """
+        rows = ExchangeRate.objects.filter(
+            to_currency_id__in=from_ids | {to_currency.pk},
+            date__range=(date_obj - timedelta(days=CurrencyService.RATE_FALLBACK_DAYS), date_obj)
+        ).order_by().values_list('from_currency_id', 'to_currency_id', 'rate', 'date')
+
+        # {(base_id, date): {quoted_currency_id: rate}}
+        quotes = {}
+        for base_id, quoted_id, rate, rate_date in rows:
+            quotes.setdefault((base_id, rate_date), {})[quoted_id] = rate
+
+        found = {}
+        found_dates = {}
+        for (_, rate_date), legs in quotes.items():
+            to_rate = legs.get(to_currency.pk)
+            if to_rate is None:
+                continue
+            for currency_id, from_rate in legs.items():
+                if currency_id == to_currency.pk or from_rate <= 0:
+                    continue
+                if currency_id not in found or rate_date > found_dates[currency_id]:
+                    found[currency_id] = to_rate / from_rate
+                    found_dates[currency_id] = rate_date
+
+        return found
+
+    @staticmethod
+    def bulk_get_exchange_rates(from_currency_ids, to_currency, date_obj=None):
+        """
+        Get exchange rates from several currencies into one target currency.
+
+        Cached rates are read with one get_many(); the rest are resolved with
+        a single query, using the same precedence as get_exchange_rate():
+        direct rate for the date, then the inverse rate, then the most recent
+        direct rate within the last 7 days. Resolved rates are written back
+        with one set_many(), and currencies without a rate are cached as
+        missing for MISSING_RATE_CACHE_TIMEOUT seconds, as in
+        warm_rate_cache().
+
+        Args:
+            from_currency_ids: Iterable of source Currency IDs
+            to_currency: Target Currency object
+            date_obj: Date object (default: today)
+
+        Returns:
+            dict: {from_currency_id: Decimal rate or None if not found}
+        """
+        if date_obj is None:
+            date_obj = date.today()
+
+        from_ids = set(from_currency_ids)
+        rates = dict.fromkeys(from_ids)
+
+        # Same currency
+        if to_currency.pk in from_ids:
+            rates[to_currency.pk] = _ONE
+            from_ids.discard(to_currency.pk)
+
+        if not from_ids:
+            return rates
+
+        # Try cache first
+        version = CurrencyService._rate_cache_version(date_obj)
+        cache_keys = {}
+        for currency_id in from_ids:
+            currency = CurrencyCache.get_by_id(currency_id)
+            if currency is not None:
+                cache_keys[currency_id] = CurrencyService._rate_cache_key(
+                    currency.code, to_currency.code, date_obj, version
+                )
+        cached = cache.get_many(list(cache_keys.values()))
+        for currency_id, cache_key in cache_keys.items():
+            if cached.get(cache_key) is not None:
+                if cached[cache_key] != _MISSING_RATE:
+                    rates[currency_id] = CurrencyService._cached_rate_to_decimal(cached[cache_key])
+                from_ids.discard(currency_id)
+
+        if not from_ids:
+            return rates
+
+        found = CurrencyService._query_rates(from_ids, to_currency, date_obj)
+
+        to_cache = {}
+        missing = {}
+        for currency_id in from_ids:
+            if currency_id not in found:
+                logger.warning(f"No exchange rate found for currency {currency_id} to {to_currency.code} on {date_obj}")
+                if currency_id in cache_keys:
+                    missing[cache_keys[currency_id]] = _MISSING_RATE
+                continue
+            rates[currency_id] = found[currency_id]
+            if currency_id in cache_keys:
+                to_cache[cache_keys[currency_id]] = rates[currency_id]
+
+        if to_cache:
+            cache.set_many(to_cache, CurrencyService.CACHE_TIMEOUT)
+        if missing:
+            cache.set_many(missing, CurrencyService.MISSING_RATE_CACHE_TIMEOUT)
+
+        return rates
+
     @staticmethod
     def convert(amount, from_currency, to_currency, date_obj=None):
         """
@@ -246,6 +875,10 @@ class CurrencyService:
         if isinstance(amount, (int, float)):
             amount = Decimal(str(amount))
 
+        # Same currency, nothing to look up
+        if CurrencyService._currency_code(from_currency) == CurrencyService._currency_code(to_currency):
+            return amount
+
         rate = CurrencyService.get_exchange_rate(from_currency, to_currency, date_obj)
 
         if rate is None:
@@ -254,15 +887,194 @@ class CurrencyService:
 
         return amount * rate
 
+    @staticmethod
+    def convert_many(amounts, to_currency, date_obj=None):
+        """
+        Convert several amounts into one target currency.
+
+        Rates are loaded once via bulk_get_exchange_rates() instead of
+        calling convert() per amount.
+
+        Args:
+            amounts: List of (amount, from_currency_id) tuples
+            to_currency: Target Currency object
+            date_obj: Date object (default: today)
+
+        Returns:
+            list: Converted Decimal amounts in input order. Amounts without a
+            known rate are returned unchanged, as in convert().
+        """
+        rates = CurrencyService.bulk_get_exchange_rates(
+            {currency_id for _, currency_id in amounts},
+            to_currency,
+            date_obj
+        )
+
+        converted = []
+        for amount, currency_id in amounts:
+            rate = rates[currency_id]
+            if rate is None:
+                logger.warning(f"Could not convert {amount} from currency {currency_id} to {to_currency.code}, returning original amount")
+                converted.append(amount)
+            else:
+                converted.append(amount * rate)
+
+        return converted
+
+    @staticmethod
+    def _rate_cache_version(date_obj):
+        """
+        Get the generation of the rates cached for a date.
+
+        Every rate, missing-rate marker and rate matrix cached for the date
+        has the generation in its key, so bumping it retires them all at
+        once. A missing generation restarts from the current time rather
+        than from 1, so keys of an evicted generation are never reused.
+
+        Args:
+            date_obj: Date the rates apply to
+
+        Returns:
+            int: Current generation
+        """
+        key = f"{CurrencyService.RATE_VERSION_KEY_PREFIX}_{date_obj}"
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), CurrencyService.CACHE_TIMEOUT)
+            # Another process may have added it first
+            version = cache.get(key, 0)
+        return version
+
+    @staticmethod
+    def _rate_cache_key(from_code, to_code, date_obj, version):
+        """Build the cache key of one pair's rate (or missing-rate marker)."""
+        return f"{CurrencyService.CACHE_KEY_PREFIX}_{from_code}_{to_code}_{date_obj}_{version}"
+
+    @staticmethod
+    def invalidate_rate_cache(date_obj):
+        """
+        Retire cached rates that may have been derived from a stored rate.
+
+        A stored rate can be served for its own date and, as a fallback, for
+        the following RATE_FALLBACK_DAYS days, directly or triangulated into
+        any pair. Bumping the cache generation of each of those dates drops
+        every rate, missing-rate marker and rate matrix cached for them.
+
+        Args:
+            date_obj: Date of the changed rate(s)
+        """
+        for days in range(CurrencyService.RATE_FALLBACK_DAYS + 1):
+            key = f"{CurrencyService.RATE_VERSION_KEY_PREFIX}_{date_obj + timedelta(days=days)}"
+            try:
+                cache.incr(key)
+            except ValueError:
+                # No generation yet: nothing has been cached for that date
+                pass
+        CurrencyService.clear_rate_memo()
+
+    @staticmethod
+    def clear_currency_cache():
+        """
+        Drop the in-process CurrencyCache so it is reloaded on next use,
+        along with the cached list of active currency codes.
+        """
+        CurrencyCache.clear()
+        cache.delete(CurrencyService.ACTIVE_CODES_CACHE_KEY)
+
+    @staticmethod
+    def get_rate_matrix(to_currency, date_obj=None):
+        """
+        Get the rates from every known currency into one target currency.
+
+        The whole map is cached as a single entry, so loops converting many
+        amounts into the same currency need one cache read (or one query on
+        a miss) in total. Rates follow the same precedence as
+        get_exchange_rate(). A matrix missing any currency's rate is cached
+        for MISSING_RATE_CACHE_TIMEOUT only.
+
+        Args:
+            to_currency: Target Currency object
+            date_obj: Date object (default: today)
+
+        Returns:
+            dict: {from_currency_id: Decimal rate}; currencies without a
+            known rate are absent
+        """
+        if date_obj is None:
+            date_obj = date.today()
+
+        version = CurrencyService._rate_cache_version(date_obj)
+        cache_key = f"{CurrencyService.MATRIX_CACHE_KEY_PREFIX}_{to_currency.code}_{date_obj}_{version}"
+        matrix = cache.get(cache_key)
+        if matrix is None:
+            from_ids = {
+                currency_id for currency_id in CurrencyCache.ids()
+                if currency_id != to_currency.pk
+            }
+            matrix = CurrencyService._query_rates(from_ids, to_currency, date_obj)
+            # A matrix with gaps is kept only as long as a missing-rate
+            # marker, so rates stored later in the day are picked up
+            timeout = (
+                CurrencyService.MISSING_RATE_CACHE_TIMEOUT if from_ids - matrix.keys()
+                else CurrencyService.CACHE_TIMEOUT
+            )
+            matrix[to_currency.pk] = _ONE
+            cache.set(cache_key, matrix, timeout)
+
+        return matrix
+
+    @staticmethod
+    def convert_with_matrix(amount, from_currency_id, matrix):
+        """
+        Convert an amount using a map returned by bulk_get_exchange_rates()
+        or get_rate_matrix().
+
+        Args:
+            amount: Amount to convert (Decimal)
+            from_currency_id: Source Currency ID
+            matrix: {from_currency_id: rate or None} into the target currency
+
+        Returns:
+            Decimal: Converted amount, or the original amount if no rate is
+            known (as in convert())
+        """
+        rate = matrix.get(from_currency_id)
+        if rate is None:
+            logger.warning(f"Could not convert {amount} from currency {from_currency_id}, returning original amount")
+            return amount
+        return amount * rate
+
     @staticmethod
     def get_all_active_currencies():
         """
         Get all active currencies.
 
+        Only the display columns (code, name, symbol) are loaded.
+
         Returns:
             QuerySet: Active Currency objects
         """
-        return Currency.objects.filter(is_active=True).order_by('code')
+        return Currency.objects.filter(is_active=True).only('code', 'name', 'symbol').order_by('code')
+
+    @staticmethod
+    def get_active_currency_codes():
+        """
+        Get the codes of all active currencies.
+
+        The list is kept in the shared cache for an hour, so every process
+        sees changes made elsewhere within that time; clear_currency_cache()
+        drops it whenever a currency is saved or deleted.
+
+        Returns:
+            list: Sorted currency codes
+        """
+        return cache.get_or_set(
+            CurrencyService.ACTIVE_CODES_CACHE_KEY,
+            lambda: list(
+                Currency.objects.filter(is_active=True).order_by('code').values_list('code', flat=True)
+            ),
+            CurrencyService.ACTIVE_CODES_CACHE_TIMEOUT
+        )
 
     @staticmethod
     def ensure_currency_exists(currency_code, name=None, symbol=None):
@@ -277,6 +1089,10 @@ class CurrencyService:
         Returns:
             Currency: Currency object
         """
+        currency = CurrencyCache.get_by_code(currency_code.upper())
+        if currency is not None:
+            return currency
+
         currency, created = Currency.objects.get_or_create(
             code=currency_code.upper(),
             defaults={
@@ -0,0 +1,25 @@
+"""
+Signal handlers for currency models.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Currency, ExchangeRate
+from .services import CurrencyService
+
+
+@receiver([post_save, post_delete], sender=Currency)
+def clear_currency_cache(sender, instance, **kwargs):
+    """
+    Drop the in-process currency cache when a currency is saved or deleted.
+    """
+    CurrencyService.clear_currency_cache()
+
+
+@receiver([post_save, post_delete], sender=ExchangeRate)
+def invalidate_rate_cache(sender, instance, **kwargs):
+    """
+    Drop cached rates derived from an exchange rate when it is saved or deleted.
+
+    Bulk rate updates send no signals; they refresh the cache themselves.
+    """
+    CurrencyService.invalidate_rate_cache(instance.date)
@@ -24,7 +24,7 @@ def update_exchange_rates():
     try:
         # Update rates for USD as base currency
         # You can add more base currencies here if needed: ['USD', 'EUR', 'GBP']
-        results = CurrencyService.update_all_exchange_rates(base_currencies=['USD'])
+        results = CurrencyService.update_all_exchange_rates(base_currencies=['USD'], wait=True)
 
         total_updated = sum(r['rates_updated'] for r in results.values())
         logger.info(f"Exchange rate update completed. Total rates updated: {total_updated}")
@@ -57,7 +57,7 @@ def update_exchange_rates_for_currencies(currency_codes):
     logger.info(f"Updating exchange rates for currencies: {currency_codes}")
 
     try:
-        results = CurrencyService.update_all_exchange_rates(base_currencies=currency_codes)
+        results = CurrencyService.update_all_exchange_rates(base_currencies=currency_codes, wait=True)
 
         total_updated = sum(r['rates_updated'] for r in results.values())
         logger.info(f"Exchange rate update completed for {len(currency_codes)} currencies. Total rates updated: {total_updated}")
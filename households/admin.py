@@ -44,10 +44,13 @@ class HouseholdAdmin(admin.ModelAdmin):
         """Display member count."""
         return obj.get_members_count()
     get_members_count.short_description = 'Members Count'
+    get_members_count.admin_order_field = '_members_count'
 
     def get_queryset(self, request):
         """Filter queryset for non-superusers to only show households they're part of."""
-        qs = super().get_queryset(request)
+        # Count members in the changelist query instead of once per row;
+        # annotate before the membership filter so it counts every member
+        qs = super().get_queryset(request).with_member_counts()
         if not request.user.is_superuser:
             qs = qs.filter(members__user=request.user).distinct()
         return qs
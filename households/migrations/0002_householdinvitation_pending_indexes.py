@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("households", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="householdinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["expires_at"],
+                name="hh_inv_pending_exp_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="householdinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["household", "expires_at"],
+                name="hh_inv_pending_hh_exp_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("households", "0002_householdinvitation_pending_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="householdmember",
+            index=models.Index(
+                condition=models.Q(("role", "OWNER")),
+                fields=["household"],
+                name="hh_member_owner_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Invitation tokens become UUIDs: a fixed 16-byte uuid column on
+# PostgreSQL (char(32) elsewhere) instead of a varchar(100) unique index.
+# Existing UUID-shaped tokens are kept; any other token is re-issued so
+# the column type change can cast every row.
+
+import uuid
+
+from django.db import migrations, models
+
+
+def normalize_tokens(apps, schema_editor):
+    HouseholdInvitation = apps.get_model("households", "HouseholdInvitation")
+    invitations = []
+    for invitation in HouseholdInvitation.objects.only("token"):
+        try:
+            token = uuid.UUID(invitation.token).hex
+        except ValueError:
+            token = uuid.uuid4().hex
+        if token != invitation.token:
+            invitation.token = token
+            invitations.append(invitation)
+    HouseholdInvitation.objects.bulk_update(invitations, ["token"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("households", "0003_householdmember_owner_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="householdinvitation",
+            name="token",
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                help_text="Unique invitation token",
+                unique=True,
+            ),
+        ),
+    ]
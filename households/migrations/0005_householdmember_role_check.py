@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("households", "0004_householdinvitation_token_uuid"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="householdmember",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("role__in", ["OWNER", "MEMBER", "VIEWER"])),
+                name="hh_member_role_valid",
+            ),
+        ),
+    ]
@@ -1,11 +1,51 @@
 """
 Household and Family management models.
 """
+import uuid
+
 from django.conf import settings
 from django.db import models
 from django.core.exceptions import ValidationError
 
 
+class HouseholdQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for Household lists.
+    """
+
+    def with_member_counts(self):
+        """
+        Annotate each household with its number of members.
+
+        Household.get_members_count() returns the annotation instead of
+        issuing a COUNT per household.
+
+        Returns:
+            QuerySet: Households annotated with _members_count
+        """
+        return self.annotate(_members_count=models.Count('members'))
+
+    def for_user(self, user):
+        """
+        Annotate each household with the given user's membership.
+
+        Household.is_owner() and can_user_manage() read the annotated role
+        for that user instead of querying per household.
+
+        Args:
+            user: User object whose membership is resolved
+
+        Returns:
+            QuerySet: Households annotated with is_member and user_role
+        """
+        memberships = HouseholdMember.objects.filter(household=models.OuterRef('pk'), user=user)
+        return self.annotate(
+            is_member=models.Exists(memberships),
+            user_role=models.Subquery(memberships.values('role')[:1]),
+            _role_user_id=models.Value(user.pk),
+        )
+
+
 class Household(models.Model):
     """
     Represents a household/family group that can track combined net worth.
@@ -35,6 +75,8 @@ class Household(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = HouseholdQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Household"
         verbose_name_plural = "Households"
@@ -57,9 +99,14 @@ class Household(models.Model):
         """
         Get the number of members in this household.
 
+        Uses the _members_count annotation when the household was loaded
+        through Household.objects.with_member_counts().
+
         Returns:
             int: Number of members
         """
+        if hasattr(self, '_members_count'):
+            return self._members_count
         return self.members.count()
 
     def is_owner(self, user):
@@ -72,12 +119,27 @@ class Household(models.Model):
         Returns:
             bool: True if user is owner
         """
-        try:
-            member = self.members.get(user=user)
-            return member.role == HouseholdMember.OWNER
-        except HouseholdMember.DoesNotExist:
+        # Anonymous and unsaved users own nothing
+        if user.pk is None:
             return False
 
+        # Loaded through Household.objects.for_user(user): no query needed.
+        # Checked in __dict__ so an unannotated household is never mistaken
+        # for an annotated one.
+        if '_role_user_id' in self.__dict__ and self._role_user_id == user.pk:
+            return self.user_role == HouseholdMember.OWNER
+
+        # Memoized per instance: permission checks ask repeatedly while a
+        # request renders. Saving or deleting a membership through its
+        # household clears the memo.
+        owner_cache = self.__dict__.setdefault('_owner_cache', {})
+        if user.pk not in owner_cache:
+            # Single EXISTS served by the (household, user) unique index
+            owner_cache[user.pk] = self.members.filter(
+                user=user, role=HouseholdMember.OWNER
+            ).exists()
+        return owner_cache[user.pk]
+
     def can_user_manage(self, user):
         """
         Check if user can manage (add/remove members) this household.
@@ -91,6 +153,45 @@ class Household(models.Model):
         return self.is_owner(user)
 
 
+class HouseholdMemberQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for household memberships.
+    """
+
+    def add_or_ignore(self, household, user, role=None, fetch=False):
+        """
+        Add a user to a household unless they are already a member.
+
+        Delegates to HouseholdService.add_members(), which issues a single
+        INSERT ... ON CONFLICT DO NOTHING and relies on the (household, user)
+        unique constraint instead of checking for an existing membership
+        first. Model validation is skipped.
+
+        Args:
+            household: Household object
+            user: User object
+            role: Role for a new membership (defaults to HouseholdMember.MEMBER)
+            fetch: Whether to load and return the resulting membership
+
+        Returns:
+            HouseholdMember: The membership if fetch is True, otherwise None
+        """
+        from households.services import HouseholdService
+        HouseholdService.add_members(household, [user], role=role)
+        if fetch:
+            return self.get(household=household, user=user)
+        return None
+
+
+# Module level so HouseholdMember.Meta, whose body cannot see the class
+# namespace, can derive the role check constraint from the same list
+MEMBER_ROLE_CHOICES = [
+    ('OWNER', 'Owner'),
+    ('MEMBER', 'Member'),
+    ('VIEWER', 'Viewer'),
+]
+
+
 class HouseholdMember(models.Model):
     """
     Represents a user's membership in a household with specific role and permissions.
@@ -106,11 +207,7 @@ class HouseholdMember(models.Model):
     MEMBER = 'MEMBER'
     VIEWER = 'VIEWER'
 
-    ROLE_CHOICES = [
-        (OWNER, 'Owner'),
-        (MEMBER, 'Member'),
-        (VIEWER, 'Viewer'),
-    ]
+    ROLE_CHOICES = MEMBER_ROLE_CHOICES
 
     household = models.ForeignKey(
         Household,
@@ -136,39 +233,133 @@ class HouseholdMember(models.Model):
     )
     joined_at = models.DateTimeField(auto_now_add=True)
 
+    objects = HouseholdMemberQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Household Member"
         verbose_name_plural = "Household Members"
         unique_together = ['household', 'user']
         ordering = ['-joined_at']
+        # save() does not run full_clean(); the database rejects unknown roles
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(role__in=[value for value, _ in MEMBER_ROLE_CHOICES]),
+                name='hh_member_role_valid',
+            ),
+        ]
+        indexes = [
+            # Owners only: serves the last-owner check in clean()
+            models.Index(
+                fields=['household'],
+                name='hh_member_owner_idx',
+                condition=models.Q(role='OWNER'),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.household.name} ({self.get_role_display()})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the role loaded from the database so clean() can tell
+        whether an owner is being demoted.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'role' in field_names:
+            instance._loaded_role = instance.role
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Keep the remembered role in sync with the saved row.
+        """
+        super().save(*args, **kwargs)
+        self._loaded_role = self.role
+        self._clear_household_owner_cache()
+
+    def delete(self, *args, **kwargs):
+        """
+        Drop the household's memoized ownership checks along with the row.
+        """
+        result = super().delete(*args, **kwargs)
+        self._clear_household_owner_cache()
+        return result
+
+    def _clear_household_owner_cache(self):
+        """
+        Forget is_owner() results memoized or annotated on an already
+        loaded household.
+        """
+        if self._meta.get_field('household').is_cached(self):
+            self.household.__dict__.pop('_owner_cache', None)
+            self.household.__dict__.pop('_role_user_id', None)
+
     def clean(self):
         """
         Validate that each household has at least one owner.
+
+        Called through full_clean() by model forms (including the admin);
+        save() does not validate, so service code that bypasses forms must
+        keep at least one owner itself.
         """
         super().clean()
 
+        # Only demoting a member who is currently an owner can remove the
+        # last owner; members loaded with a non-owner role skip the query
+        if getattr(self, '_loaded_role', self.OWNER) != self.OWNER:
+            return
+
         # If removing the last owner, raise error
         if self.role != self.OWNER and self.pk:
-            owners_count = HouseholdMember.objects.filter(
-                household=self.household,
+            # Filter on the FK id so self.household is never loaded
+            other_owner_exists = HouseholdMember.objects.filter(
+                household_id=self.household_id,
                 role=self.OWNER
-            ).exclude(pk=self.pk).count()
+            ).exclude(pk=self.pk).exists()
 
-            if owners_count == 0:
+            if not other_owner_exists:
                 raise ValidationError(
                     "Cannot change role: Household must have at least one owner."
                 )
 
-    def save(self, *args, **kwargs):
+
+class HouseholdInvitationQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for looking up invitations.
+    """
+
+    def pending(self):
         """
-        Override save to run validation.
+        Restrict to invitations that are pending and not yet expired.
+
+        Returns:
+            QuerySet: Invitations that can still be accepted
         """
-        self.full_clean()
-        super().save(*args, **kwargs)
+        from django.utils import timezone
+        return self.filter(status=HouseholdInvitation.PENDING, expires_at__gt=timezone.now())
+
+    def valid(self, token):
+        """
+        Fetch a still-valid invitation by token in a single query.
+
+        Equivalent to loading the invitation by token and calling
+        is_valid(), but only the columns needed to accept it are loaded.
+
+        Args:
+            token: Invitation token (UUID or its string form)
+
+        Returns:
+            HouseholdInvitation: The invitation, or None if unknown or no longer valid
+        """
+        # Tokens come from URLs; a malformed one matches no invitation
+        try:
+            token = uuid.UUID(str(token))
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return self.pending().filter(token=token).only(
+            'id', 'household', 'email', 'role'
+        ).first()
 
 
 class HouseholdInvitation(models.Model):
@@ -223,9 +414,10 @@ class HouseholdInvitation(models.Model):
         default=PENDING,
         help_text="Invitation status"
     )
-    token = models.CharField(
-        max_length=100,
+    token = models.UUIDField(
+        default=uuid.uuid4,
         unique=True,
+        editable=False,
         help_text="Unique invitation token"
     )
     created_at = models.DateTimeField(auto_now_add=True)
@@ -233,10 +425,26 @@ class HouseholdInvitation(models.Model):
         help_text="When invitation expires"
     )
 
+    objects = HouseholdInvitationQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Household Invitation"
         verbose_name_plural = "Household Invitations"
         ordering = ['-created_at']
+        # Pending invitations are a small fraction of the table; partial
+        # indexes keep expiry sweeps and per-household lookups on them small
+        indexes = [
+            models.Index(
+                fields=['expires_at'],
+                name='hh_inv_pending_exp_idx',
+                condition=models.Q(status='PENDING'),
+            ),
+            models.Index(
+                fields=['household', 'expires_at'],
+                name='hh_inv_pending_hh_exp_idx',
+                condition=models.Q(status='PENDING'),
+            ),
+        ]
 
     def __str__(self):
         return f"Invitation to {self.email} for {self.household.name}"
@@ -0,0 +1,41 @@
+"""
+Household membership services.
+"""
+from django.db import transaction
+
+
+class HouseholdService:
+    """
+    Service layer for household-related business logic.
+    """
+
+    @staticmethod
+    def add_members(household, users, role=None, can_view_details=True):
+        """
+        Add several users to a household in a single INSERT.
+
+        Model validation is skipped; users who are already members are left
+        untouched by the unique (household, user) constraint.
+
+        Args:
+            household: Household object
+            users: Iterable of User objects
+            role: Role for the new members (defaults to HouseholdMember.MEMBER)
+            can_view_details: Whether the new members can see detailed info
+
+        Returns:
+            list: HouseholdMember objects passed to bulk_create
+        """
+        from households.models import HouseholdMember
+
+        members = [
+            HouseholdMember(
+                household=household,
+                user=user,
+                role=role or HouseholdMember.MEMBER,
+                can_view_details=can_view_details,
+            )
+            for user in users
+        ]
+        with transaction.atomic():
+            return HouseholdMember.objects.bulk_create(members, ignore_conflicts=True)
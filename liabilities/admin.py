@@ -11,7 +11,9 @@ class LiabilityHistoryInline(admin.TabularInline):
     """
     model = LiabilityHistory
     extra = 0
-    readonly_fields = ['recorded_at']
+    # currency is shown as text: an editable select would query every
+    # currency once per history row
+    readonly_fields = ['currency', 'recorded_at']
     fields = ['balance', 'currency', 'source', 'recorded_at']
     can_delete = False
     ordering = ['-recorded_at']
@@ -20,6 +22,10 @@ class LiabilityHistoryInline(admin.TabularInline):
         """Disable manual addition of history records."""
         return False
 
+    def get_queryset(self, request):
+        """Load each history row's currency in the same query."""
+        return super().get_queryset(request).select_related('currency')
+
 
 @admin.register(Liability)
 class LiabilityAdmin(admin.ModelAdmin):
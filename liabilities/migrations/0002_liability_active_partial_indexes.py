@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("currencies", "0003_currency_active_code_index"),
+        ("liabilities", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="liability",
+            name="liabilities_user_id_0c9f1c_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="liability",
+            name="liabilities_user_id_d9fc82_idx",
+        ),
+        migrations.AddIndex(
+            model_name="liability",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "liability_type"],
+                name="liab_active_user_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="liability",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "-updated_at"],
+                name="liab_active_user_upd_idx",
+            ),
+        ),
+    ]
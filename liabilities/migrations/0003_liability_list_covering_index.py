@@ -0,0 +1,39 @@
+# Replace the partial (user, -updated_at) index with a covering one so
+# liability list pages, which read name, liability_type, balance and
+# currency_id ordered by -updated_at, are answered by index-only scans.
+#
+# INCLUDE columns are PostgreSQL-only; on other backends the user_id
+# foreign key index serves these lists.
+
+from django.db import migrations
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX liab_list_covering ON liabilities_liability "
+        "(user_id, updated_at DESC) INCLUDE (name, liability_type, balance, currency_id) "
+        "WHERE is_active"
+    )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS liab_list_covering")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("liabilities", "0002_liability_active_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="liability",
+            name="liab_active_user_upd_idx",
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
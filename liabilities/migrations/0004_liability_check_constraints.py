@@ -0,0 +1,68 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("currencies", "0003_currency_active_code_index"),
+        ("liabilities", "0003_liability_list_covering_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="liability",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("balance__gte", 0)), name="liab_balance_nonneg"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="liability",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("interest_rate__isnull", True),
+                    models.Q(("interest_rate__gte", 0), ("interest_rate__lte", 100)),
+                    _connector="OR",
+                ),
+                name="liab_rate_range",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="liability",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("monthly_payment__isnull", True),
+                    ("monthly_payment__gte", 0),
+                    _connector="OR",
+                ),
+                name="liab_payment_nonneg",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="liability",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("credit_limit__isnull", True),
+                    ("credit_limit__gte", 0),
+                    _connector="OR",
+                ),
+                name="liab_credit_limit_nonneg",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="liability",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("payment_due_date__isnull", True),
+                    models.Q(
+                        ("payment_due_date__gte", 1), ("payment_due_date__lte", 31)
+                    ),
+                    _connector="OR",
+                ),
+                name="liab_due_date_range",
+            ),
+        ),
+    ]
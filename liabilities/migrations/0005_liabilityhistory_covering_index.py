@@ -0,0 +1,38 @@
+# Replace the (liability, -recorded_at) index with a covering index so
+# balance-over-time reads, which select recorded_at, balance and
+# currency_id per liability, are answered by index-only scans.
+#
+# INCLUDE columns are PostgreSQL-only; on other backends the liability_id
+# foreign key index serves these reads.
+
+from django.db import migrations
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX liab_hist_cover_idx ON liabilities_liabilityhistory "
+        "(liability_id, recorded_at DESC) INCLUDE (balance, currency_id)"
+    )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS liab_hist_cover_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("liabilities", "0004_liability_check_constraints"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="liabilityhistory",
+            name="liabilities_liabili_768f13_idx",
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
@@ -4,7 +4,63 @@ Liability tracking models for various debt types.
 from django.conf import settings
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.functions import Round
 from decimal import Decimal
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Computed credit utilization percentages are rounded to ten decimal
+# places, in SQL and in Python
+UTILIZATION_PLACES = Decimal('1E-10')
+
+
+class _UtilizationPercent(models.Func):
+    """
+    balance * 100 / credit_limit as a decimal percentage.
+
+    Other backends divide NUMERIC values exactly. SQLite has no decimal
+    type and stores whole-number decimals as integers, so there the
+    product is taken with 100.0 to keep the division from truncating.
+    """
+    template = '(%(expressions)s)'
+    arg_joiner = ' * 100 / '
+    arity = 2
+    output_field = models.DecimalField(max_digits=30, decimal_places=15)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, arg_joiner=' * 100.0 / ', **extra_context)
+
+
+class LiabilityQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for Liability lists.
+    """
+
+    def with_utilization(self):
+        """
+        Annotate each liability with its credit utilization percentage.
+
+        Computed in SQL for credit cards with a positive credit limit and
+        NULL otherwise, so lists can filter and order on it. Values are
+        rounded to ten decimal places, as get_credit_utilization() does.
+
+        Returns:
+            QuerySet: Liabilities annotated with credit_utilization
+        """
+        output_field = models.DecimalField(max_digits=20, decimal_places=10)
+        return self.annotate(
+            credit_utilization=models.Case(
+                models.When(
+                    liability_type=Liability.CREDIT_CARD,
+                    credit_limit__gt=0,
+                    then=Round(_UtilizationPercent('balance', 'credit_limit'), 10, output_field=output_field),
+                ),
+                default=None,
+                output_field=output_field,
+            )
+        )
 
 
 class Liability(models.Model):
@@ -150,17 +206,64 @@ class Liability(models.Model):
         help_text="When balance was last updated"
     )
 
+    objects = LiabilityQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Liability"
         verbose_name_plural = "Liabilities"
         ordering = ['-updated_at']
+        # Reads filter on is_active=True, so soft-deleted rows are left out
+        # of the indexes
         indexes = [
-            models.Index(fields=['user', 'liability_type', 'is_active']),
-            models.Index(fields=['user', 'is_active', '-updated_at']),
+            models.Index(
+                fields=['user', 'liability_type'],
+                name='liab_active_user_type_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
+        # Mirror the field validators in the database so writes that skip
+        # full_clean() (bulk updates, service code) keep the same invariants
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(balance__gte=0),
+                name='liab_balance_nonneg',
+            ),
+            models.CheckConstraint(
+                condition=(
+                    models.Q(interest_rate__isnull=True)
+                    | models.Q(interest_rate__gte=0, interest_rate__lte=100)
+                ),
+                name='liab_rate_range',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(monthly_payment__isnull=True) | models.Q(monthly_payment__gte=0),
+                name='liab_payment_nonneg',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(credit_limit__isnull=True) | models.Q(credit_limit__gte=0),
+                name='liab_credit_limit_nonneg',
+            ),
+            models.CheckConstraint(
+                condition=(
+                    models.Q(payment_due_date__isnull=True)
+                    | models.Q(payment_due_date__gte=1, payment_due_date__lte=31)
+                ),
+                name='liab_due_date_range',
+            ),
         ]
+        # PostgreSQL also gets a covering (user_id, updated_at DESC) INCLUDE
+        # (name, liability_type, balance, currency_id) WHERE is_active index
+        # for list pages (migration 0003)
 
     def __str__(self):
-        return f"{self.name} - {self.currency.code} {self.balance}"
+        # Unless the currency was select_related, take its code from the
+        # in-process cache rather than querying once per liability
+        if Liability.currency.is_cached(self):
+            currency = self.currency
+        else:
+            from currencies.services import CurrencyCache
+            currency = CurrencyCache.get_by_id(self.currency_id)
+        return f"{self.name} - {currency.code} {self.balance}"
 
     def get_balance_in_currency(self, target_currency):
         """
@@ -172,15 +275,19 @@ class Liability(models.Model):
         Returns:
             Decimal: Balance in target currency
         """
-        if self.currency == target_currency:
+        # Compare ids so the identity case never loads self.currency
+        if self.currency_id == target_currency.pk:
             return self.balance
 
         from currencies.services import CurrencyService
-        return CurrencyService.convert(
-            amount=self.balance,
-            from_currency=self.currency,
-            to_currency=target_currency
-        )
+        # Rates are memoized per (from, to, date), so converting many
+        # liabilities in the same currency looks the rate up once
+        rate = CurrencyService.get_rate(self.currency_id, target_currency.pk)
+        if rate is None:
+            # Same fallback as CurrencyService.convert()
+            logger.warning(f"Could not convert {self.balance} from currency {self.currency_id} to {target_currency.code}, returning original amount")
+            return self.balance
+        return self.balance * rate
 
     def get_credit_utilization(self):
         """
@@ -191,35 +298,78 @@ class Liability(models.Model):
         """
         if self.liability_type == self.CREDIT_CARD and self.credit_limit:
             if self.credit_limit > 0:
-                return (self.balance / self.credit_limit) * 100
+                return ((self.balance / self.credit_limit) * 100).quantize(UTILIZATION_PLACES)
         return None
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the balance loaded from the database so save() can detect
+        balance changes without querying the row again.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'balance' in field_names:
+            instance._loaded_balance = instance.balance
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """
+        Keep the remembered database balance in sync after a refresh.
+        """
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or 'balance' in fields:
+            self._loaded_balance = self.balance
+
     def save(self, *args, **kwargs):
         """
         Override save to create history record on balance change.
         """
-        is_new = self.pk is None
+        # None means no row existed yet; balance is NOT NULL, so any stored
+        # balance compares unequal to None and new rows always get history
         old_balance = None
 
-        if not is_new:
-            try:
-                old_liability = Liability.objects.get(pk=self.pk)
-                old_balance = old_liability.balance
-            except Liability.DoesNotExist:
-                pass
+        if self.pk is not None:
+            if hasattr(self, '_loaded_balance'):
+                old_balance = self._loaded_balance
+            else:
+                # Instance was not loaded from the database (e.g. built with a pk)
+                old_balance = Liability.objects.filter(pk=self.pk).values_list('balance', flat=True).first()
 
         super().save(*args, **kwargs)
+        self._loaded_balance = self.balance
 
         # Create history record if balance changed or new liability
-        if is_new or (old_balance and old_balance != self.balance):
+        if old_balance != self.balance:
             LiabilityHistory.objects.create(
                 liability=self,
                 balance=self.balance,
-                currency=self.currency,
+                currency_id=self.currency_id,
                 source=LiabilityHistory.MANUAL
             )
 
 
+class LiabilityHistoryQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for reading liability history.
+    """
+
+    def timeseries(self, liability_id):
+        """
+        Get a liability's balance history as plain rows for charts and reports.
+
+        Rows are returned as dicts rather than model instances, oldest first.
+
+        Args:
+            liability_id: ID of the liability
+
+        Returns:
+            QuerySet: Dicts with recorded_at, balance and currency__code keys
+        """
+        return self.filter(liability_id=liability_id).order_by('recorded_at').values(
+            'recorded_at', 'balance', 'currency__code'
+        )
+
+
 class LiabilityHistory(models.Model):
     """
     Historical record of liability balances over time.
@@ -269,13 +419,16 @@ class LiabilityHistory(models.Model):
         help_text="How this balance was recorded"
     )
 
+    objects = LiabilityHistoryQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Liability History"
         verbose_name_plural = "Liability Histories"
         ordering = ['-recorded_at']
-        indexes = [
-            models.Index(fields=['liability', '-recorded_at']),
-        ]
+        # Rows are read per liability by recorded_at. PostgreSQL gets a
+        # covering (liability_id, recorded_at DESC) INCLUDE (balance,
+        # currency_id) index (migration 0005); other backends use the
+        # liability foreign key index.
 
     def __str__(self):
         return f"{self.liability.name} - {self.currency.code} {self.balance} at {self.recorded_at}"
@@ -1,8 +1,11 @@
 """
 Liability calculation and management services.
 """
-from decimal import Decimal
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Sum
+from django.utils import timezone
+from currencies.services import ZERO
 
 
 class LiabilityService:
@@ -10,29 +13,73 @@ class LiabilityService:
     Service layer for liability-related business logic.
     """
 
+    CACHE_TIMEOUT = 300  # 5 minutes in seconds
+    CACHE_KEY_PREFIX = 'liability_total'
+
     @staticmethod
     def calculate_total_liabilities(user):
         """
         Calculate total balance of all active liabilities for a user in their home currency.
 
+        The result is cached per user for CACHE_TIMEOUT seconds and
+        invalidated whenever one of the user's liabilities is saved or deleted.
+
         Args:
             user: User object
 
         Returns:
             Decimal: Total liability balance in user's home currency
         """
+        home_currency = user.get_home_currency()
+
+        cache_key = f"{LiabilityService.CACHE_KEY_PREFIX}_{user.pk}"
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == home_currency.pk:
+            return cached[1]
+
+        total = LiabilityService._sum_liabilities_in_currency(user, home_currency)
+        cache.set(cache_key, (home_currency.pk, total), LiabilityService.CACHE_TIMEOUT)
+        return total
+
+    @staticmethod
+    def invalidate_total_liabilities(user_id):
+        """
+        Drop the cached liability total for a user.
+
+        Args:
+            user_id: ID of the user whose liabilities changed
+        """
+        cache.delete(f"{LiabilityService.CACHE_KEY_PREFIX}_{user_id}")
+
+    @staticmethod
+    def _sum_liabilities_in_currency(user, home_currency):
+        """
+        Sum a user's active liabilities converted into home_currency.
+
+        Args:
+            user: User object
+            home_currency: Currency object to convert into
+
+        Returns:
+            Decimal: Total liability balance in home_currency
+        """
+        from currencies.services import CurrencyService
         from liabilities.models import Liability
 
-        home_currency = user.get_home_currency()
-        total = Decimal('0.00')
+        total = ZERO
 
-        # Get all active liabilities for the user
-        liabilities = Liability.objects.filter(user=user, is_active=True)
+        # Sum balances per currency in the database, then convert each
+        # currency's subtotal once instead of every liability
+        subtotals = list(Liability.objects.filter(
+            user=user,
+            is_active=True
+        ).values('currency_id').annotate(subtotal=Sum('balance')))
+        rates = CurrencyService.bulk_get_exchange_rates(
+            {row['currency_id'] for row in subtotals}, home_currency
+        )
 
-        for liability in liabilities:
-            # Convert each liability to home currency
-            converted_balance = liability.get_balance_in_currency(home_currency)
-            total += converted_balance
+        for row in subtotals:
+            total += CurrencyService.convert_with_matrix(row['subtotal'], row['currency_id'], rates)
 
         return total
 
@@ -68,16 +115,26 @@ class LiabilityService:
         Returns:
             dict: Dictionary with liability types as keys and total balances as values
         """
+        from currencies.services import CurrencyService
         from liabilities.models import Liability
 
         home_currency = user.get_home_currency()
         breakdown = {}
 
-        liabilities = Liability.objects.filter(user=user, is_active=True)
+        # Sum active liabilities per (type, currency) in a single GROUP BY query
+        subtotals = list(Liability.objects.filter(
+            user=user,
+            is_active=True
+        ).values('liability_type', 'currency_id').annotate(subtotal=Sum('balance')))
+        rates = CurrencyService.bulk_get_exchange_rates(
+            {row['currency_id'] for row in subtotals}, home_currency
+        )
 
-        for liability in liabilities:
-            liability_type = liability.liability_type
-            converted_balance = liability.get_balance_in_currency(home_currency)
+        for row in subtotals:
+            liability_type = row['liability_type']
+            converted_balance = CurrencyService.convert_with_matrix(
+                row['subtotal'], row['currency_id'], rates
+            )
 
             if liability_type in breakdown:
                 breakdown[liability_type] += converted_balance
@@ -97,25 +154,81 @@ class LiabilityService:
         Returns:
             Decimal: Total monthly payments in user's home currency
         """
+        from currencies.services import CurrencyService
         from liabilities.models import Liability
 
         home_currency = user.get_home_currency()
-        total = Decimal('0.00')
+        total = ZERO
 
-        liabilities = Liability.objects.filter(
+        # Monthly payments are summed per currency and converted directly;
+        # liabilities with a zero balance still count if a payment is set
+        subtotals = list(Liability.objects.filter(
             user=user,
             is_active=True,
             monthly_payment__isnull=False
+        ).values('currency_id').annotate(subtotal=Sum('monthly_payment')))
+        rates = CurrencyService.bulk_get_exchange_rates(
+            {row['currency_id'] for row in subtotals}, home_currency
         )
 
-        for liability in liabilities:
-            if liability.monthly_payment:
-                # Convert monthly payment to home currency
-                converted_payment = liability.get_balance_in_currency(home_currency)
-                # Scale based on the ratio of monthly payment to balance
-                if liability.balance > 0:
-                    payment_ratio = liability.monthly_payment / liability.balance
-                    converted_payment = converted_payment * payment_ratio
-                    total += converted_payment
+        for row in subtotals:
+            total += CurrencyService.convert_with_matrix(row['subtotal'], row['currency_id'], rates)
 
         return total
+
+    @staticmethod
+    def bulk_apply_balances(user, updates):
+        """
+        Apply new balances to several of a user's liabilities at once.
+
+        Changed liabilities are written with one bulk UPDATE and their
+        history records with one bulk INSERT. Liability.save() is bypassed,
+        so history is recorded here instead.
+
+        Args:
+            user: User object owning the liabilities
+            updates: List of (liability_id, new_balance, source) tuples, where
+                new_balance is a Decimal and source a LiabilityHistory source
+
+        Returns:
+            int: Number of liabilities whose balance changed
+        """
+        from liabilities.models import Liability, LiabilityHistory
+
+        # Only the columns compared or copied into history are loaded
+        liabilities = Liability.objects.filter(user=user).only('balance', 'currency_id').in_bulk(
+            [liability_id for liability_id, _, _ in updates]
+        )
+        now = timezone.now()
+        changed = {}
+        history = []
+
+        for liability_id, new_balance, source in updates:
+            liability = liabilities.get(liability_id)
+            if liability is None or liability.balance == new_balance:
+                continue
+
+            liability.balance = new_balance
+            liability.updated_at = now
+            liability.last_valued_at = now
+            changed[liability_id] = liability
+            history.append(LiabilityHistory(
+                liability=liability,
+                balance=new_balance,
+                currency_id=liability.currency_id,
+                source=source
+            ))
+
+        with transaction.atomic():
+            Liability.objects.bulk_update(
+                changed.values(),
+                ['balance', 'updated_at', 'last_valued_at'],
+                batch_size=500
+            )
+            LiabilityHistory.objects.bulk_create(history, batch_size=500)
+
+        # bulk_update() does not send post_save, so drop the cached total here
+        if changed:
+            LiabilityService.invalidate_total_liabilities(user.pk)
+
+        return len(changed)
@@ -0,0 +1,17 @@
+"""
+Signal handlers for liability models.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Liability
+from .services import LiabilityService
+
+
+@receiver([post_save, post_delete], sender=Liability)
+def invalidate_liability_total(sender, instance, **kwargs):
+    """
+    Drop the owner's cached liability total when a liability is saved or deleted.
+
+    LiabilityHistory changes are ignored; they do not affect the total.
+    """
+    LiabilityService.invalidate_total_liabilities(instance.user_id)
@@ -11,6 +11,9 @@ class NetWorthSnapshotAdmin(admin.ModelAdmin):
     Admin interface for NetWorthSnapshot model.
     """
     list_display = ['get_owner', 'net_worth', 'total_assets', 'total_liabilities', 'currency', 'debt_to_asset_ratio', 'snapshot_date', 'created_at']
+    list_select_related = ['user', 'household', 'currency']
+    # Skip the unfiltered COUNT(*) shown next to filtered result counts
+    show_full_result_count = False
     list_filter = ['currency', 'snapshot_date', 'created_at']
     search_fields = ['user__username', 'household__name']
     ordering = ['-snapshot_date']
@@ -51,14 +54,20 @@ class NetWorthSnapshotAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Filter queryset for non-superusers to only show their own snapshots."""
-        qs = super().get_queryset(request).select_related('user', 'household', 'currency')
+        qs = super().get_queryset(request)
         if not request.user.is_superuser:
-            # Show snapshots where user is the owner or part of the household
+            # Show snapshots where user is the owner or part of the household.
+            # Household ids are resolved first so the snapshot query needs no
+            # join through memberships and no DISTINCT.
             from django.db.models import Q
+            from households.models import HouseholdMember
+            household_ids = list(
+                HouseholdMember.objects.filter(user=request.user).values_list('household_id', flat=True)
+            )
             qs = qs.filter(
                 Q(user=request.user) |
-                Q(household__members__user=request.user)
-            ).distinct()
+                Q(household_id__in=household_ids)
+            )
         return qs
 
     def get_form(self, request, obj=None, **kwargs):
@@ -5,6 +5,10 @@ from django.conf import settings
 from django.db import models
 from django.core.validators import MinValueValidator
 from decimal import Decimal
+from currencies.services import ZERO
+
+
+HUNDRED = Decimal('100')
 
 
 class NetWorthSnapshot(models.Model):
@@ -104,17 +108,21 @@ class NetWorthSnapshot(models.Model):
         Validate that snapshot has either user or household (but not both).
         """
         from django.core.exceptions import ValidationError
-        if not self.user and not self.household:
+        # Compare FK ids so validation never loads the user or household
+        if self.user_id is None and self.household_id is None:
             raise ValidationError("Snapshot must belong to either a user or a household.")
-        if self.user and self.household:
+        if self.user_id is not None and self.household_id is not None:
             raise ValidationError("Snapshot cannot belong to both a user and a household.")
 
     def save(self, *args, **kwargs):
         """
         Override save to run validation and auto-calculate financial data.
+
+        Only the owner check in clean() runs here; field validation is left
+        to forms, and uniqueness to the database constraints.
         """
         # Run validation
-        self.full_clean()
+        self.clean()
 
         # Auto-calculate financial data if not provided
         if self.user:
@@ -134,19 +142,14 @@ class NetWorthSnapshot(models.Model):
                 self.currency = self.household.created_by.get_home_currency()
 
             if self.total_assets is None or self.total_liabilities is None:
-                # Calculate household totals
-                from decimal import Decimal
-                total_assets = Decimal('0.00')
-                total_liabilities = Decimal('0.00')
-
-                for member in self.household.members.select_related('user'):
-                    total_assets += member.user.get_total_assets()
-                    total_liabilities += member.user.get_total_liabilities()
+                # Calculate household totals across all members at once
+                from assets.models import Asset
+                from liabilities.models import Liability
 
                 if self.total_assets is None:
-                    self.total_assets = total_assets
+                    self.total_assets = self._sum_household_in_currency(Asset, 'value')
                 if self.total_liabilities is None:
-                    self.total_liabilities = total_liabilities
+                    self.total_liabilities = self._sum_household_in_currency(Liability, 'balance')
 
         # Calculate net worth
         if self.net_worth is None:
@@ -159,6 +162,35 @@ class NetWorthSnapshot(models.Model):
 
         super().save(*args, **kwargs)
 
+    def _sum_household_in_currency(self, model, amount_field):
+        """
+        Sum the household members' active assets or liabilities in one query.
+
+        Amounts are summed per currency in the database, then each subtotal
+        is converted into the snapshot currency once.
+
+        Args:
+            model: Asset or Liability model class
+            amount_field: Name of the amount column ('value' or 'balance')
+
+        Returns:
+            Decimal: Total in the snapshot currency
+        """
+        from currencies.services import CurrencyService
+
+        subtotals = list(model.objects.filter(
+            user__household_memberships__household_id=self.household_id,
+            is_active=True
+        ).values('currency_id').annotate(subtotal=models.Sum(amount_field)))
+        rates = CurrencyService.bulk_get_exchange_rates(
+            {row['currency_id'] for row in subtotals}, self.currency
+        )
+
+        total = ZERO
+        for row in subtotals:
+            total += CurrencyService.convert_with_matrix(row['subtotal'], row['currency_id'], rates)
+        return total
+
     @property
     def debt_to_asset_ratio(self):
         """
@@ -168,8 +200,8 @@ class NetWorthSnapshot(models.Model):
             Decimal: Ratio of liabilities to assets (or 0 if no assets)
         """
         if self.total_assets and self.total_assets > 0:
-            return (self.total_liabilities / self.total_assets) * 100
-        return Decimal('0.00')
+            return (self.total_liabilities / self.total_assets) * HUNDRED
+        return ZERO
 
     @classmethod
     def get_latest_for_user(cls, user):